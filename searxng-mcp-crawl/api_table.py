@@ -0,0 +1,39 @@
+"""
+customAPI 설정 파싱 (runLLM과 shared_api_config가 함께 사용)
+"""
+
+from typing import Any, Dict, Tuple
+
+
+def build_api_table(
+    config: Dict[str, Any]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str], str]:
+    """Parse a customAPI config into (apis, plugin_mappings, default)"""
+    custom_apis = {}
+
+    apis = config.get("apis", {})
+    for api_name, api_config in apis.items():
+        if not api_name.startswith("customAPI"):
+            continue
+
+        url = api_config.get("url", "").strip()
+        api_key = api_config.get("apiKey", "").strip()
+        model = api_config.get("model", "").strip()
+
+        if url and api_key and model:
+            custom_apis[api_name] = {
+                "url": url,
+                "apiKey": api_key,
+                "model": model,
+                "name": api_name,
+                "headers": {
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {api_key}",
+                },
+            }
+
+    return (
+        custom_apis,
+        config.get("plugin_mappings", {}),
+        config.get("default", "customAPI1"),
+    )
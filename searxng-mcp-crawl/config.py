@@ -1,18 +1,51 @@
 ﻿import os
+import sys
+import logging
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# SearXNG Configuration
-SEARXNG_BASE_URL = os.getenv('SEARXNG_BASE_URL', 'http://localhost:32768')
 
-# API Configuration
-HOST = os.getenv('HOST', '0.0.0.0')
-PORT = int(os.getenv('PORT', '32769'))
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable server configuration (read once from the environment)"""
+    SEARXNG_BASE_URL: str
+    HOST: str
+    PORT: int
+    CONTENT_MAX_LENGTH: int
+    SEARCH_RESULT_LIMIT: int
+    USER_AGENT: str
+    LOG_LEVEL: str
 
-# Crawler Configuration
-CONTENT_MAX_LENGTH = int(os.getenv('CONTENT_MAX_LENGTH', '10000'))
-SEARCH_RESULT_LIMIT = int(os.getenv('SEARCH_RESULT_LIMIT', '10'))
 
-# User Agent
-USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+CFG = Config(
+    # SearXNG Configuration
+    SEARXNG_BASE_URL=os.getenv('SEARXNG_BASE_URL', 'http://localhost:32768'),
+
+    # API Configuration
+    HOST=os.getenv('HOST', '0.0.0.0'),
+    PORT=int(os.getenv('PORT', '32769')),
+
+    # Crawler Configuration
+    CONTENT_MAX_LENGTH=int(os.getenv('CONTENT_MAX_LENGTH', '10000')),
+    SEARCH_RESULT_LIMIT=int(os.getenv('SEARCH_RESULT_LIMIT', '10')),
+
+    # User Agent
+    USER_AGENT='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+
+    # Logging (DEBUG shows per-request details)
+    LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO').upper(),
+)
+
+logging.basicConfig(level=CFG.LOG_LEVEL, stream=sys.stderr, format='%(message)s')
+logging.getLogger('httpx').setLevel(logging.WARNING)  # per-request lines are too noisy at INFO
+
+# Module-level aliases for existing imports
+SEARXNG_BASE_URL = CFG.SEARXNG_BASE_URL
+HOST = CFG.HOST
+PORT = CFG.PORT
+CONTENT_MAX_LENGTH = CFG.CONTENT_MAX_LENGTH
+SEARCH_RESULT_LIMIT = CFG.SEARCH_RESULT_LIMIT
+USER_AGENT = CFG.USER_AGENT
+LOG_LEVEL = CFG.LOG_LEVEL
@@ -1,7 +1,127 @@
 import httpx
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable, Hashable
 import asyncio
+import importlib.util
+import logging
+import random
+from functools import lru_cache
+import re
+import time
+from urllib.parse import urlsplit
+from config import CFG
+
+try:
+    # C 기반 JSON 파서 (stdlib json 대비 2-3배 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # C 기반 HTML 파서 (BeautifulSoup 대비 10배 이상 빠름)
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # aiohttp 기반 httpx 트랜스포트 (고부하에서 anyio 기반 기본 트랜스포트보다 안정적)
+    from httpx_aiohttp import AiohttpTransport
+except ImportError:
+    AiohttpTransport = None
+
+log = logging.getLogger(__name__)
+
+# HTTP/2 requires the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Brotli decoding requires brotli/brotlicffi (pip install httpx[brotli]); never advertise br without it
+ACCEPT_ENCODING = "gzip, deflate, br" if (
+    importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+) else "gzip, deflate"
+
+# BeautifulSoup fallback parser: lxml if installed, otherwise pure-Python
+BS4_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Elements dropped before extracting page text
+_STRIP_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+_STRIP_SELECTOR = ", ".join(_STRIP_TAGS)
+
+# Line-boundary whitespace (incl. blank lines) collapsed to one newline in a single pass
+_WS_RE = re.compile(r'[^\S\r\n]*[\r\n]\s*')
+
+# Non-"text/*" media types that still carry extractable text
+_TEXT_CONTENT_TYPES = frozenset(("application/xhtml+xml", "application/xml", "application/json"))
+
+# Streaming download floor: pages often carry large inline scripts before the body
+MIN_DOWNLOAD_BYTES = 512 * 1024
+
+# Placeholder origin routed to the Unix socket when SEARXNG_BASE_URL is unix://
+SEARXNG_UDS_URL = "http://searxng.sock"
+
+# SearXNG returns roughly this many results per page
+RESULTS_PER_PAGE = 10
+
+# SearXNG request pacing and retry policy
+SEARCH_RATE_PER_SECOND = 5
+SEARCH_MAX_ATTEMPTS = 5
+
+# Connection failures mean SearXNG is down: retry briefly with a short capped
+# exponential backoff (0.25s, 0.5s), then skip it for a while
+CONNECT_MAX_ATTEMPTS = 3
+CONNECT_RETRY_DELAY = 0.25
+CONNECT_MAX_DELAY = 1.0
+SEARXNG_DOWN_TTL = 30
+
+# Successful page fetches are reused this long (pages change; keep it short)
+FETCH_CACHE_TTL = 600
+
+# Definitive fetch failures (4xx except 408/429) are remembered this long so
+# repeated requests for a blocked/missing page don't hit the network again
+NEGATIVE_CACHE_TTL = 60
+_TRANSIENT_STATUS = frozenset((408, 429))
+
+# Simultaneous fetches allowed against a single host in fetch_webpages
+PER_HOST_CONCURRENCY = 8
+
+# Mock search result templates: (title, url slug, description)
+_MOCK_TEMPLATES = (
+    ("Wikipedia", "wiki", "Wikipedia article"),
+    ("Official Site", "site", "Official website"),
+    ("Comprehensive Guide", "guide", "Detailed guide"),
+    ("Tutorial", "tutorial", "Step-by-step tutorial"),
+    ("Latest News", "news", "Breaking news"),
+    ("Community Forum", "forum", "Discussion forum"),
+    ("Expert Blog", "blog", "Professional blog post"),
+    ("Video Tutorial", "video", "Video guide"),
+    ("Documentation", "docs", "Official docs"),
+    ("Review", "review", "Expert review"),
+    ("Research Paper", "research", "Academic research"),
+    ("Analysis", "analysis", "In-depth analysis"),
+    ("Comparison", "compare", "Detailed comparison"),
+    ("FAQ", "faq", "Common questions"),
+    ("Tools & Resources", "tools", "Useful tools"),
+    ("Case Study", "case", "Real-world example"),
+    ("Best Practices", "best", "Industry standards"),
+    ("Beginner's Guide", "beginner", "Introduction"),
+    ("Advanced Topics", "advanced", "Expert-level"),
+    ("Industry Report", "report", "Market analysis"),
+    ("Trends", "trends", "Current trends"),
+    ("Statistics", "stats", "Data and statistics"),
+    ("Infographic", "infographic", "Visual guide"),
+    ("Podcast", "podcast", "Audio discussion"),
+    ("Webinar", "webinar", "Online seminar"),
+    ("Course", "course", "Learning material"),
+    ("Template", "template", "Ready-to-use template"),
+    ("Checklist", "checklist", "Action checklist"),
+    ("Timeline", "timeline", "Historical overview"),
+    ("Database", "database", "Resource database"),
+)
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Host part of a URL (memoized: search results repeat the same hosts)"""
+    return urlsplit(url).netloc
 
 class WebCrawler:
     """
@@ -9,14 +129,111 @@ class WebCrawler:
     Includes mock mode for testing without SearXNG
     """
     
-    def __init__(self, mock_mode: bool = False):
-        self.searxng_url = "http://localhost:32768/search"
+    def __init__(
+        self,
+        mock_mode: bool = False,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        use_aiohttp_transport: bool = False
+    ):
+        """
+        Args:
+            max_connections: 커넥션 풀 상한 (작은 서버는 낮게, 대량 크롤링은 높게)
+            max_keepalive_connections: 재사용을 위해 열어 둘 유휴 커넥션 수
+            use_aiohttp_transport: httpx-aiohttp 트랜스포트 사용 (설치된 경우, 풀 상한은 aiohttp가 관리)
+        """
+        base_url = (base_url or CFG.SEARXNG_BASE_URL).rstrip('/')
         self.mock_mode = mock_mode
         
+        # unix:///path/to.sock → 같은 호스트의 SearXNG에 TCP 없이 Unix 소켓으로 연결
+        mounts = None
+        if base_url.startswith("unix://"):
+            socket_path = base_url[len("unix://"):]
+            mounts = {SEARXNG_UDS_URL: httpx.AsyncHTTPTransport(uds=socket_path)}
+            base_url = SEARXNG_UDS_URL
+        
+        self.searxng_url = f"{base_url}/search"
+        
+        transport = None
+        if use_aiohttp_transport:
+            if AiohttpTransport is not None:
+                transport = AiohttpTransport()
+            else:
+                log.warning("   ⚠️ httpx-aiohttp not installed, using default transport")
+        
+        # 모든 요청이 공유하는 keep-alive 커넥션 풀 (요청마다 TCP/TLS 핸드셰이크 방지)
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            transport=transport,
+            mounts=mounts,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=15.0
+            )
+        )
+        
+        # 동시 페이지 요청 상한 (SearXNG 과부하 방지)
+        self._page_semaphore = asyncio.Semaphore(5)
+        self._limiter = AsyncLimiter(SEARCH_RATE_PER_SECOND, 1)
+        
+        # 결과 캐시 (값은 Task: 동일한 동시 요청은 하나의 네트워크 호출로 합쳐짐)
+        self._search_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._fetch_cache = TTLCache(maxsize=1024, ttl=FETCH_CACHE_TTL)
+        self._failed_fetch_cache = TTLCache(maxsize=1024, ttl=NEGATIVE_CACHE_TTL)
+        
+        # SearXNG 연결 실패 시 이 시각(monotonic)까지는 바로 mock 결과 사용
+        self._searxng_down_until = 0.0
+        
         if self.mock_mode:
-            print(f"   🎭 WebCrawler initialized in MOCK MODE")
+            log.info("   🎭 WebCrawler initialized in MOCK MODE")
         else:
-            print(f"   🌐 WebCrawler initialized: {self.searxng_url}")
+            log.info("   🌐 WebCrawler initialized: %s", self.searxng_url)
+    
+    async def warmup(self):
+        """Pre-resolve DNS and open a keep-alive connection to SearXNG (best-effort)"""
+        if self.mock_mode:
+            return
+        
+        try:
+            await self._client.get(self.searxng_url[:-len("/search")], timeout=5.0)
+            log.info("   🔥 SearXNG connection warmed up")
+        except Exception as e:
+            log.debug("   ⚠️ SearXNG warmup skipped: %s", e)
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached result for key, sharing in-flight calls"""
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            cache[key] = task
+        
+        try:
+            # shield: 한 호출자가 취소돼도 다른 대기자의 Task는 유지
+            return await asyncio.shield(task)
+        except Exception:
+            # 실패는 캐시하지 않음
+            if cache.get(key) is task:
+                cache.pop(key, None)
+            raise
     
     async def search_searxng(
         self, 
@@ -30,179 +247,216 @@ class WebCrawler:
         """Search using SearXNG with multi-page support"""
         
         if self.mock_mode:
-            print(f"   🎭 MOCK: Returning fake results for '{query}'")
+            log.info("   🎭 MOCK: Returning fake results for '%s'", query)
             return self._generate_mock_results(query, limit)
         
+        if time.monotonic() < self._searxng_down_until:
+            log.warning(
+                "   🎭 SearXNG unreachable in the last %ds, returning MOCK results",
+                SEARXNG_DOWN_TTL
+            )
+            return self._generate_mock_results(query, limit)
+        
+        key = (query, limit, category, language, time_range, safe_search)
+        
         try:
-            all_results = []
-            page = 1
-            max_pages = 10  # 최대 10페이지 (충분히 많이)
+            results = await self._cached(
+                self._search_cache,
+                key,
+                lambda: self._search_live(query, limit, category, language, time_range, safe_search)
+            )
             
-            print(f"   🌐 SearXNG: {self.searxng_url}")
-            print(f"      Query: {query}, Target limit: {limit}")
+            # 빈 결과는 일시적 차단(CAPTCHA 등)일 수 있으므로 캐시하지 않음
+            if not results:
+                self._search_cache.pop(key, None)
             
-            while len(all_results) < limit and page <= max_pages:
-                params = {
-                    "q": query,
-                    "format": "json",
-                    "pageno": page,
-                    "categories": category,
-                    "safesearch": safe_search
-                }
-                
-                if language != "auto":
-                    params["language"] = language
+            # 캐시된 결과 dict를 호출자끼리 공유하지 않도록 항목까지 복사
+            return [dict(r) for r in results]
+        
+        except Exception as e:
+            if isinstance(e, httpx.ConnectError):
+                self._searxng_down_until = time.monotonic() + SEARXNG_DOWN_TTL
+            log.warning("   ⚠️ SearXNG error: %.100s", e)
+            log.warning("   🎭 Falling back to MOCK results")
+            return self._generate_mock_results(query, limit)
+    
+    async def _search_live(
+        self,
+        query: str,
+        limit: int,
+        category: str,
+        language: str,
+        time_range: str,
+        safe_search: int
+    ) -> List[Dict[str, Any]]:
+        """Run the SearXNG search (raises when no results could be fetched)"""
+        
+        all_results = []
+        next_page = 1
+        max_pages = 10  # 최대 10페이지 (충분히 많이)
+        
+        params = {
+            "q": query,
+            "format": "json",
+            "categories": category,
+            "safesearch": safe_search
+        }
+        
+        if language != "auto":
+            params["language"] = language
+        
+        if time_range:
+            params["time_range"] = time_range
+        
+        log.info("   🌐 SearXNG: %s", self.searxng_url)
+        log.info("      Query: %s, Target limit: %d", query, limit)
+        
+        while len(all_results) < limit and next_page <= max_pages:
+            # 필요한 페이지 수를 미리 계산해서 동시에 요청
+            needed = -(-(limit - len(all_results)) // RESULTS_PER_PAGE)
+            pages = range(next_page, min(max_pages, next_page + needed - 1) + 1)
+            next_page = pages[-1] + 1
+            
+            log.debug("      🚀 Fetching pages %d-%d concurrently", pages[0], pages[-1])
+            
+            page_results_list = await asyncio.gather(
+                *[self._fetch_page(params, page) for page in pages],
+                return_exceptions=True
+            )
+            
+            exhausted = False
+            for page, page_results in zip(pages, page_results_list):
+                if isinstance(page_results, Exception):
+                    # 결과가 하나도 없으면 실패 처리 (mock fallback)
+                    if not all_results:
+                        raise page_results
+                    log.warning("      ⚠️ Page %d failed: %.100s", page, page_results)
+                    exhausted = True
+                    break
                 
-                if time_range:
-                    params["time_range"] = time_range
+                if not page_results:
+                    log.debug("      ⚠️ No more results on page %d", page)
+                    exhausted = True
+                    break
                 
-                for attempt in range(1, 4):
-                    try:
-                        async with httpx.AsyncClient(
-                            timeout=10.0,
-                            follow_redirects=True
-                        ) as client:
-                            print(f"      🔄 Page {page}, Attempt {attempt}/3...")
-                            
-                            response = await client.get(
-                                self.searxng_url,
-                                params=params,
-                                headers={"User-Agent": "MCP-Search-Bot/2.0"}
-                            )
-                            
-                            print(f"      📡 Status: {response.status_code}")
-                            
-                            response.raise_for_status()
-                            data = response.json()
-                            
-                            page_results = data.get("results", [])
-                            
-                            if not page_results:
-                                print(f"      ⚠️ No more results on page {page}")
-                                return self._format_results(all_results, limit, category)
-                            
-                            all_results.extend(page_results)
-                            print(f"      ✅ Got {len(page_results)} results (total: {len(all_results)}/{limit})")
-                            
-                            # 목표 달성
-                            if len(all_results) >= limit:
-                                return self._format_results(all_results, limit, category)
-                            
-                            page += 1
-                            await asyncio.sleep(0.5)  # 서버 부담 줄이기
-                            break  # attempt 루프 탈출
-                    
-                    except (httpx.ConnectError, httpx.TimeoutException) as e:
-                        if attempt < 3:
-                            await asyncio.sleep(1)
-                            continue
-                        raise
+                # limit을 넘는 결과는 보관하지 않음 (동시 검색 시 메모리 절약)
+                all_results.extend(page_results[:limit - len(all_results)])
+                log.debug("      ✅ Page %d: %d results (total: %d/%d)", page, len(page_results), len(all_results), limit)
                 
-                # Attempt 루프 실패 시
-                if len(all_results) == 0:
-                    raise Exception("Failed to fetch any results")
+                if len(all_results) >= limit:
+                    break
             
-            # Max pages 도달
-            return self._format_results(all_results, limit, category)
+            if exhausted:
+                break
         
-        except Exception as e:
-            print(f"   ⚠️ SearXNG error: {str(e)[:100]}")
-            print(f"   🎭 Falling back to MOCK results")
-            return self._generate_mock_results(query, limit)
+        return self._format_results(all_results, limit, category)
     
-    def _format_results(self, results: List[Dict], limit: int, category: str) -> List[Dict[str, Any]]:
-        """Format and limit search results"""
-        results = results[:limit]
+    async def _fetch_page(self, params: Dict[str, Any], page: int) -> List[Dict[str, Any]]:
+        """Fetch a single SearXNG results page with retry"""
+        page_params = {**params, "pageno": page}
         
-        formatted_results = []
-        for idx, result in enumerate(results, 1):
-            formatted_results.append({
+        async with self._page_semaphore:
+            for attempt in range(1, SEARCH_MAX_ATTEMPTS + 1):
+                try:
+                    log.debug("      🔄 Page %d, Attempt %d/%d...", page, attempt, SEARCH_MAX_ATTEMPTS)
+                    
+                    # 토큰 버킷으로 SearXNG 요청 속도를 미리 제한
+                    async with self._limiter:
+                        response = await self._client.get(
+                            self.searxng_url,
+                            params=page_params,
+                            headers={"User-Agent": "MCP-Search-Bot/2.0"}
+                        )
+                    
+                    log.debug("      📡 Page %d status: %d", page, response.status_code)
+                    
+                    response.raise_for_status()
+                    data = orjson.loads(response.content) if orjson else response.json()
+                    
+                    return data.get("results", [])
+                
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if (status == 429 or status >= 500) and attempt < SEARCH_MAX_ATTEMPTS:
+                        # 지수 백오프 + jitter (0.5, 1, 2, 4s ...)
+                        backoff = min(60, 0.5 * 2 ** (attempt - 1))
+                        log.warning("      ⏳ HTTP %d, retrying in %.1fs...", status, backoff)
+                        await asyncio.sleep(backoff + random.random())
+                        continue
+                    raise
+                
+                except (httpx.ConnectError, httpx.TimeoutException):
+                    # 연결 실패는 짧은 상한의 지수 백오프로만 재시도 (SearXNG가 꺼져 있으면 빨리 mock으로)
+                    if attempt < CONNECT_MAX_ATTEMPTS:
+                        await asyncio.sleep(
+                            min(CONNECT_MAX_DELAY, CONNECT_RETRY_DELAY * 2 ** (attempt - 1))
+                        )
+                        continue
+                    raise
+    
+    def _format_results(self, results: List[Dict], limit: int, category: str) -> List[Dict[str, Any]]:
+        """Format search results"""
+        formatted_results = [
+            {
                 "position": idx,
-                "title": result.get("title", "No title"),
-                "url": result.get("url", ""),
-                "content": result.get("content", "No description"),
-                "engine": result.get("engine", "unknown"),
-                "category": result.get("category", category)
-            })
-        
-        print(f"      ✅ Final: {len(formatted_results)} results")
+                "title": r.get("title", "No title"),
+                "url": r.get("url", ""),
+                "content": r.get("content", "No description"),
+                "engine": r.get("engine", "unknown"),
+                "category": r.get("category", category)
+            }
+            for idx, r in enumerate(results[:limit], 1)
+        ]
+        
+        log.info("      ✅ Final: %d results", len(formatted_results))
         return formatted_results
     
     def _generate_mock_results(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """Generate mock search results for testing"""
         
-        templates = [
-            ("Wikipedia", "wiki", "Wikipedia article"),
-            ("Official Site", "site", "Official website"),
-            ("Comprehensive Guide", "guide", "Detailed guide"),
-            ("Tutorial", "tutorial", "Step-by-step tutorial"),
-            ("Latest News", "news", "Breaking news"),
-            ("Community Forum", "forum", "Discussion forum"),
-            ("Expert Blog", "blog", "Professional blog post"),
-            ("Video Tutorial", "video", "Video guide"),
-            ("Documentation", "docs", "Official docs"),
-            ("Review", "review", "Expert review"),
-            ("Research Paper", "research", "Academic research"),
-            ("Analysis", "analysis", "In-depth analysis"),
-            ("Comparison", "compare", "Detailed comparison"),
-            ("FAQ", "faq", "Common questions"),
-            ("Tools & Resources", "tools", "Useful tools"),
-            ("Case Study", "case", "Real-world example"),
-            ("Best Practices", "best", "Industry standards"),
-            ("Beginner's Guide", "beginner", "Introduction"),
-            ("Advanced Topics", "advanced", "Expert-level"),
-            ("Industry Report", "report", "Market analysis"),
-            ("Trends", "trends", "Current trends"),
-            ("Statistics", "stats", "Data and statistics"),
-            ("Infographic", "infographic", "Visual guide"),
-            ("Podcast", "podcast", "Audio discussion"),
-            ("Webinar", "webinar", "Online seminar"),
-            ("Course", "course", "Learning material"),
-            ("Template", "template", "Ready-to-use template"),
-            ("Checklist", "checklist", "Action checklist"),
-            ("Timeline", "timeline", "Historical overview"),
-            ("Database", "database", "Resource database"),
-        ]
+        url_safe_query = query.replace(' ', '-')
+        n_templates = len(_MOCK_TEMPLATES)
         
-        mock_results = []
-        for idx in range(min(limit, len(templates))):
-            title_suffix, url_part, content_desc = templates[idx]
-            mock_results.append({
+        mock_results = [None] * limit
+        for idx in range(limit):
+            title_suffix, url_part, content_desc = _MOCK_TEMPLATES[idx % n_templates]
+            
+            # 템플릿을 한 바퀴 돈 이후에는 번호를 붙여 변형
+            if idx < n_templates:
+                title = f"{title_suffix}: {query}"
+                content = f"Mock result {idx+1}: {content_desc} about {query}. This is a comprehensive resource with detailed information."
+            else:
+                title = f"{title_suffix} #{idx+1}: {query}"
+                content = f"Mock result {idx+1}: Additional {content_desc} about {query}."
+            
+            mock_results[idx] = {
                 "position": idx + 1,
-                "title": f"{title_suffix}: {query}",
-                "url": f"https://example.com/{url_part}/{query.replace(' ', '-')}-{idx+1}",
-                "content": f"Mock result {idx+1}: {content_desc} about {query}. This is a comprehensive resource with detailed information.",
+                "title": title,
+                "url": f"https://example.com/{url_part}/{url_safe_query}-{idx+1}",
+                "content": content,
                 "engine": "mock",
                 "category": "general"
-            })
-        
-        # If limit > templates, repeat with variations
-        if limit > len(templates):
-            for idx in range(len(templates), limit):
-                template_idx = idx % len(templates)
-                title_suffix, url_part, content_desc = templates[template_idx]
-                mock_results.append({
-                    "position": idx + 1,
-                    "title": f"{title_suffix} #{idx+1}: {query}",
-                    "url": f"https://example.com/{url_part}/{query.replace(' ', '-')}-{idx+1}",
-                    "content": f"Mock result {idx+1}: Additional {content_desc} about {query}.",
-                    "engine": "mock",
-                    "category": "general"
-                })
-        
-        print(f"      🎭 Generated {len(mock_results)} mock results")
+            }
+        
+        log.info("      🎭 Generated %d mock results", len(mock_results))
         return mock_results
     
     async def fetch_webpage(
         self, 
         url: str, 
         max_length: int = 10000,
-        timeout: int = 30
+        timeout: int = 30,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
-        """Fetch and extract content from webpage"""
+        """
+        Fetch and extract content from webpage
+        
+        Returns a fresh dict per call (callers may mutate it). use_cache=False
+        drops any cached entry for the URL and fetches it again.
+        """
         
         if self.mock_mode:
-            print(f"   🎭 MOCK: Fetching fake content for {url}")
+            log.info("   🎭 MOCK: Fetching fake content for %s", url)
             return {
                 "success": True,
                 "url": url,
@@ -213,49 +467,116 @@ class WebCrawler:
                 "content_length": 1500
             }
         
+        key = (url, max_length)
+        if not use_cache:
+            self._fetch_cache.pop(key, None)
+            self._failed_fetch_cache.pop(url, None)
+        
+        failed = self._failed_fetch_cache.get(url)
+        if failed is not None:
+            return dict(failed)
+        
+        result = await self._cached(
+            self._fetch_cache,
+            key,
+            lambda: self._fetch_live(url, max_length, timeout)
+        )
+        
+        # 실패 응답은 캐시하지 않음 (재시도해도 같은 4xx는 짧게 기억)
+        if not result.get("success"):
+            self._fetch_cache.pop(key, None)
+            status = result.get("status_code", 0)
+            if 400 <= status < 500 and status not in _TRANSIENT_STATUS:
+                self._failed_fetch_cache[url] = result
+        
+        # 캐시된 dict를 호출자끼리 공유하지 않도록 복사본 반환
+        return dict(result)
+    
+    async def fetch_webpages(
+        self,
+        urls: List[str],
+        max_length: int = 10000,
+        timeout: int = 30,
+        concurrency: int = 16,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Fetch several webpages concurrently (results keep the input order, errors are returned)"""
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        async def fetch_one(url: str) -> Dict[str, Any]:
+            try:
+                host = _netloc(url)
+            except ValueError:
+                host = url
+            host_semaphore = host_semaphores.get(host)
+            if host_semaphore is None:
+                host_semaphore = host_semaphores[host] = asyncio.Semaphore(PER_HOST_CONCURRENCY)
+            # 호스트 슬롯을 먼저 잡아서 한 호스트가 전체 슬롯을 점유하지 않도록 함
+            async with host_semaphore, semaphore:
+                try:
+                    return await self.fetch_webpage(url, max_length, timeout, use_cache)
+                except Exception as e:
+                    return {"success": False, "url": url, "error": f"{type(e).__name__}: {e}"}
+        
+        return await asyncio.gather(*[fetch_one(url) for url in urls])
+    
+    async def _fetch_live(self, url: str, max_length: int, timeout: int) -> Dict[str, Any]:
+        """Download and extract a webpage (errors are returned, not raised)"""
+        
         try:
-            async with httpx.AsyncClient(
-                timeout=timeout, 
-                follow_redirects=True
-            ) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "MCP-Crawler-Bot/2.0"}
-                )
+            async with self._client.stream(
+                "GET",
+                url,
+                headers={"User-Agent": "MCP-Crawler-Bot/2.0", "Accept-Encoding": ACCEPT_ENCODING},
+                timeout=timeout
+            ) as response:
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove unwanted elements
-                for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                    element.decompose()
-                
-                # Extract text
-                text = soup.get_text(separator='\n', strip=True)
-                
-                # Clean up text
-                lines = [line.strip() for line in text.splitlines() if line.strip()]
-                content = '\n'.join(lines)[:max_length]
-                
-                # Extract metadata
-                title = soup.find('title')
-                title_text = title.get_text(strip=True) if title else ""
+                # 본문을 받기 전에 헤더만으로 PDF/이미지 등 비텍스트 응답은 건너뜀
+                content_type = response.headers.get("content-type", "").partition(";")[0].strip().lower()
+                if content_type and not (
+                    content_type.startswith("text/") or content_type in _TEXT_CONTENT_TYPES
+                ):
+                    return {
+                        "success": False,
+                        "url": url,
+                        "error": f"Unsupported content type: {content_type}"
+                    }
                 
-                description = soup.find('meta', attrs={'name': 'description'})
-                description_text = description.get('content', '') if description else ""
+                # max_length 분량의 텍스트에 충분한 만큼만 다운로드 (HTML 오버헤드 고려)
+                byte_limit = max(max_length * 8, MIN_DOWNLOAD_BYTES)
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(16384):
+                    buf.extend(chunk)
+                    if len(buf) > byte_limit:
+                        break
                 
-                language = soup.find('html')
-                language_code = language.get('lang', '') if language else ""
-                
-                return {
-                    "success": True,
-                    "url": url,
-                    "content": content,
-                    "title": title_text,
-                    "description": description_text,
-                    "language": language_code,
-                    "content_length": len(content)
-                }
+                encoding = response.charset_encoding or "utf-8"
+            
+            try:
+                html = buf.decode(encoding, errors="replace")
+            except LookupError:
+                html = buf.decode("utf-8", errors="replace")
+            # 원본 bytes와 디코딩된 str, 파싱 트리를 동시에 들고 있지 않도록 바로 해제
+            del buf
+            
+            text, title_text, description_text, language_code = self._parse_html(html)
+            del html
+            
+            # Clean up text (정리 전에 여유 있게 잘라서 버려질 부분은 처리하지 않음)
+            text = text[:max_length * 4]
+            content = _WS_RE.sub('\n', text).strip()[:max_length]
+            
+            return {
+                "success": True,
+                "url": url,
+                "content": content,
+                "title": title_text,
+                "description": description_text,
+                "language": language_code,
+                "content_length": len(content)
+            }
         
         except httpx.TimeoutException:
             return {
@@ -268,7 +589,8 @@ class WebCrawler:
             return {
                 "success": False,
                 "url": url,
-                "error": f"HTTP {e.response.status_code}"
+                "error": f"HTTP {e.response.status_code}",
+                "status_code": e.response.status_code
             }
         
         except Exception as e:
@@ -276,4 +598,69 @@ class WebCrawler:
                 "success": False,
                 "url": url,
                 "error": f"{type(e).__name__}: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    def _parse_html(self, html: str) -> Tuple[str, str, str, str]:
+        """Extract (text, title, description, language) from HTML"""
+        if LexborHTMLParser is not None:
+            return self._parse_with_selectolax(html)
+        return self._parse_with_bs4(html)
+    
+    def _parse_with_selectolax(self, html: str) -> Tuple[str, str, str, str]:
+        tree = LexborHTMLParser(html)
+        
+        # Remove unwanted elements (single traversal)
+        for node in tree.css(_STRIP_SELECTOR):
+            node.decompose()
+        
+        # 문서 전체에서 추출 (<title> 텍스트도 본문에 포함, 기존 동작 유지)
+        root = tree.root
+        text = root.text(separator='\n', strip=True) if root else ""
+        
+        title = tree.css_first('title')
+        title_text = title.text(strip=True) if title else ""
+        
+        description = tree.css_first('meta[name="description"]')
+        description_text = (description.attributes.get('content') or "") if description else ""
+        
+        language = tree.css_first('html')
+        language_code = (language.attributes.get('lang') or "") if language else ""
+        
+        return text, title_text, description_text, language_code
+    
+    def _parse_with_bs4(self, html: str) -> Tuple[str, str, str, str]:
+        # selectolax가 없을 때만 필요하므로 첫 사용 시 import (bs4 import 비용 ~80ms)
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, BS4_PARSER)
+        
+        # Remove unwanted elements (single traversal)
+        for element in soup(_STRIP_TAGS):
+            element.decompose()
+        
+        text = soup.get_text(separator='\n', strip=True)
+        
+        title = soup.find('title')
+        title_text = title.get_text(strip=True) if title else ""
+        
+        description = soup.find('meta', attrs={'name': 'description'})
+        description_text = description.get('content', '') if description else ""
+        
+        language = soup.find('html')
+        language_code = language.get('lang', '') if language else ""
+        
+        return text, title_text, description_text, language_code
+
+
+@lru_cache(maxsize=1)
+def get_crawler() -> WebCrawler:
+    """Process-wide WebCrawler (플러그인 재생성/리로드 시에도 캐시·커넥션 풀·rate limit 공유)"""
+    return WebCrawler()
+
+
+async def close_crawler() -> None:
+    """Close the process-wide WebCrawler if one was created (서버 종료 시 호출)"""
+    if get_crawler.cache_info().currsize:
+        crawler = get_crawler()
+        get_crawler.cache_clear()
+        await crawler.aclose()
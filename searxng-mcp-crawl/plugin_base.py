@@ -8,6 +8,9 @@ class MCPPlugin(ABC):
     모든 플러그인은 이 클래스를 상속받아야 합니다.
     """
     
+    # 인스턴스 속성이 없으므로 하위 클래스가 __slots__로 __dict__를 없앨 수 있게 함
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -54,6 +57,10 @@ class MCPPlugin(ABC):
         """플러그인 작성자"""
         return "Unknown"
     
+    async def warmup(self) -> None:
+        """서버 시작 시 호출되는 준비 작업 (기본: 없음, 실패해도 무시됨)"""
+        pass
+    
     def to_tool_definition(self) -> Dict[str, Any]:
         """MCP 도구 정의로 변환"""
         return {
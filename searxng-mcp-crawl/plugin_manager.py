@@ -1,34 +1,43 @@
+import asyncio
 import importlib.util
 import inspect
+import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Tuple
 from plugin_base import MCPPlugin
 
 class PluginManager:
     def __init__(self, plugins_dir: str = "plugins"):
         self.plugins_dir = Path(plugins_dir)
         self.plugins: Dict[str, MCPPlugin] = {}
+        self._tools_cache: Tuple[Dict[str, Any], ...] = ()
+        # 플러그인 파일 경로 → (mtime, 모듈): 변경되지 않은 파일은 reload 시 재실행하지 않음
+        self._module_cache: Dict[str, Tuple[float, Any]] = {}
         self.load_plugins()
     
     def load_plugins(self):
         """Load all plugins from plugins directory"""
         self.plugins.clear()
+        self._tools_cache = ()
         
         if not self.plugins_dir.exists():
             print(f"⚠️ Plugins directory not found: {self.plugins_dir}")
             return
         
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.stem.startswith("_"):
-                continue
+        # scandir: DirEntry가 이름/파일 유형을 들고 있어 파일마다 추가 stat 호출이 없음
+        with os.scandir(self.plugins_dir) as entries:
+            plugin_entries = [
+                entry for entry in entries
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("_")
+                and entry.is_file()
+            ]
+        
+        for entry in plugin_entries:
+            plugin_file = Path(entry.path)
             
             try:
-                spec = importlib.util.spec_from_file_location(
-                    plugin_file.stem,
-                    plugin_file
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                module = self._load_module(plugin_file, entry.stat().st_mtime)
                 
                 for item_name in dir(module):
                     item = getattr(module, item_name)
@@ -49,23 +58,59 @@ class PluginManager:
             except Exception as e:
                 print(f"   ❌ Failed to load {plugin_file.name}: {e}")
         
+        # 🔥 MCP 도구 정의는 로드 시 한 번만 생성 (tools/list 요청마다 재생성하지 않음)
+        self._tools_cache = tuple(
+            plugin.to_tool_definition() for plugin in self.plugins.values()
+        )
+        
         print(f"\n📦 Total plugins loaded: {len(self.plugins)}")
     
+    def _load_module(self, plugin_file: Path, mtime: float):
+        """Import a plugin file, reusing the module if the file is unchanged"""
+        key = str(plugin_file)
+        
+        cached = self._module_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        spec = importlib.util.spec_from_file_location(
+            plugin_file.stem,
+            plugin_file
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        self._module_cache[key] = (mtime, module)
+        return module
+    
     def reload_plugins(self):
         """Reload all plugins"""
         print("\n🔄 Reloading plugins...")
         self.load_plugins()
     
-    def list_plugins(self) -> List[Dict[str, Any]]:
-        """List all available plugins as MCP tools"""
-        return [
-            {
-                "name": plugin.name,
-                "description": plugin.description,
-                "inputSchema": plugin.input_schema
-            }
-            for plugin in self.plugins.values()
-        ]
+    def list_plugins(self) -> Tuple[Dict[str, Any], ...]:
+        """List all available plugins as MCP tools (built once per load, shared - don't mutate)"""
+        return self._tools_cache
+    
+    async def warmup_plugins(self):
+        """Run every plugin's warmup hook concurrently (errors are ignored)"""
+        results = await asyncio.gather(
+            *(plugin.warmup() for plugin in self.plugins.values()),
+            return_exceptions=True
+        )
+        
+        for name, result in zip(self.plugins.keys(), results):
+            if isinstance(result, Exception):
+                print(f"   ⚠️ Warmup failed for {name}: {result}")
+    
+    async def close_plugins(self):
+        """Release resources held by plugins (e.g. shared HTTP clients)"""
+        for name, plugin in self.plugins.items():
+            if hasattr(plugin, 'aclose'):
+                try:
+                    await plugin.aclose()
+                except Exception as e:
+                    print(f"   ⚠️ Failed to close {name}: {e}")
     
     async def execute_plugin(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a plugin by name"""
@@ -1,8 +1,55 @@
 from plugin_base import MCPPlugin
-from typing import Dict, Any, List
-from crawler import WebCrawler
+from typing import Dict, Any, List, Tuple, FrozenSet
+from crawler import get_crawler
 import asyncio
+import io
+import logging
+import re
 import time
+from urllib.parse import urlsplit
+
+log = logging.getLogger(__name__)
+
+# 🔥 짧은 에러 페이지 감지 (7번의 부분 문자열 검색 대신 한 번의 정규식 스캔)
+_ERROR_PAGE_RE = re.compile(
+    r"woops|oops|404|not found|page not found|access denied|forbidden",
+    re.IGNORECASE,
+)
+
+# 허용 URL 스킴
+_URL_PREFIXES = ("http://", "https://")
+
+# include_metadata 시 기본으로 채우는 필드 (metadata_fields 인자로 일부만 요청 가능)
+_METADATA_FIELDS = frozenset(("title", "description", "language", "word_count"))
+
+# 청킹 진행 표시줄: 가능한 31가지 모양을 미리 만들어 두고 인덱스로 조회
+_BAR_LENGTH = 30
+_BARS = tuple("█" * i + "░" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
+
+def _url_key(url: str) -> str:
+    """Dedup key: scheme/host are case-insensitive and fragments don't change the page"""
+    parts = urlsplit(url)
+    return parts._replace(
+        scheme=parts.scheme.lower(), netloc=parts.netloc.lower(), fragment=""
+    ).geturl()
+
+
+def _backoff_delay(results: List[Dict[str, Any]], cap: float) -> float:
+    """
+    Wait time before the next request wave, based on rate-limit signals
+
+    Only 429/5xx/timeout failures count: 404s or short pages won't improve by
+    waiting, and a clean wave needs no pause at all.
+    """
+    transient = 0
+    for r in results:
+        if not r.get("success"):
+            error = r.get("error", "")
+            if error.startswith(("HTTP 429", "HTTP 5")) or "timed out" in error:
+                transient += 1
+
+    return min(cap, 0.1 * 2**transient) if transient else 0.0
 
 
 class CrawlPlugin(MCPPlugin):
@@ -19,12 +66,17 @@ class CrawlPlugin(MCPPlugin):
 
     def __init__(self):
         try:
-            self.crawler = WebCrawler()
+            self.crawler = get_crawler()
             print("   🕷️ CrawlPlugin: Crawler initialized")
         except Exception as e:
             print(f"   ⚠️ CrawlPlugin: Crawler init error: {e}")
             self.crawler = None
 
+    async def warmup(self) -> None:
+        """Open the SearXNG connection before the first request"""
+        if self.crawler:
+            await self.crawler.warmup()
+
     @property
     def name(self) -> str:
         return "fetch_webpage"
@@ -42,6 +94,11 @@ class CrawlPlugin(MCPPlugin):
                 "urls": {"type": "array", "items": {"type": "string"}},
                 "limit": {"type": "integer", "default": 10},
                 "max_length": {"type": "integer", "default": 20000},
+                "metadata_fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Metadata to include (title, description, language, word_count). Default: all.",
+                },
             },
         }
 
@@ -54,39 +111,34 @@ class CrawlPlugin(MCPPlugin):
         return "damin25soka7"
 
     def validate_url(self, url: str) -> bool:
-        if not isinstance(url, str):
+        if not isinstance(url, str) or not url.startswith(_URL_PREFIXES):
+            return False
+        # 호스트가 없는 URL ("https://" 등) 거부
+        try:
+            return bool(urlsplit(url).netloc)
+        except ValueError:
             return False
-        return url.startswith(("http://", "https://"))
 
     def validate_content(self, content: str, min_chars: int = 100) -> bool:
         if not content or len(content) < min_chars:
             return False
 
-        error_patterns = [
-            "woops",
-            "oops",
-            "404",
-            "not found",
-            "page not found",
-            "access denied",
-            "forbidden",
-        ]
-        content_lower = content.lower()
-
-        for pattern in error_patterns:
-            if pattern in content_lower and len(content) < 500:
-                return False
+        # 에러 문구 검사는 짧은 본문(500자 미만)에만 적용
+        if len(content) >= 500:
+            return True
 
-        return True
+        return _ERROR_PAGE_RE.search(content) is None
 
     def _chunk_text(
         self, text: str, chunk_size: int, overlap: int
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Split text into overlapping chunks; returns (chunks, total chunk length)"""
         chunks = []
+        total_length = 0
         text_length = len(text)
 
         if text_length == 0:
-            return chunks
+            return chunks, total_length
 
         if chunk_size <= 0:
             chunk_size = 15000  # 15KB per chunk
@@ -111,6 +163,7 @@ class CrawlPlugin(MCPPlugin):
         while start < text_length and chunk_num <= max_chunks:
             end = min(start + chunk_size, text_length)
             chunk_content = text[start:end]
+            total_length += end - start
 
             chunks.append(
                 {
@@ -122,14 +175,14 @@ class CrawlPlugin(MCPPlugin):
                 }
             )
 
-            progress = (end / text_length) * 100
-            bar_length = 30
-            filled = int(bar_length * end / text_length)
-            bar = "█" * filled + "░" * (bar_length - filled)
+            if log.isEnabledFor(logging.DEBUG):
+                progress = (end / text_length) * 100
+                filled = int(_BAR_LENGTH * end / text_length)
 
-            print(
-                f"   [{bar}] {progress:.1f}% - Chunk {chunk_num}: {len(chunk_content):,} chars"
-            )
+                log.debug(
+                    "   [%s] %.1f%% - Chunk %d: %d chars",
+                    _BARS[filled], progress, chunk_num, len(chunk_content),
+                )
 
             if end >= text_length:
                 break
@@ -145,11 +198,69 @@ class CrawlPlugin(MCPPlugin):
         print(f"   {'='*50}")
         print(f"   ✅ Created {len(chunks)} chunks")
         print(
-            f"   📊 Avg size: {sum(c['length'] for c in chunks) // len(chunks):,} chars"
+            f"   📊 Avg size: {total_length // len(chunks):,} chars"
         )
         print(f"   {'✂️'*25}\n")
 
-        return chunks
+        return chunks, total_length
+
+    def _to_response(
+        self,
+        url: str,
+        result: Any,
+        include_metadata: bool,
+        index: int = 0,
+        metadata_fields: FrozenSet[str] = _METADATA_FIELDS,
+    ) -> Dict[str, Any]:
+        """Validate a crawler result and shape it into the per-URL response"""
+        if isinstance(result, dict):
+            if result.get("success") or "content" in result:
+                content = result.get("content", "")
+                content_length = len(content)
+
+                if not self.validate_content(content):
+                    log.warning("      [%d] ⚠️ Invalid (%d chars)", index, content_length)
+                    return {
+                        "success": False,
+                        "url": url,
+                        "error": f"Content too short ({content_length} chars)",
+                        "content_length": content_length,
+                    }
+
+                log.debug(
+                    "      [%d] ✅ Success (%d chars = %.1fKB)",
+                    index, content_length, content_length / 1000,
+                )
+
+                response = {
+                    "success": True,
+                    "url": url,
+                    "content": content,
+                    "content_length": content_length,
+                }
+
+                if include_metadata:
+                    # 요청된 필드만 생성 (word_count는 본문 전체를 분할하므로 필요할 때만)
+                    metadata = {}
+                    for field in ("title", "description", "language"):
+                        if field in metadata_fields:
+                            metadata[field] = result.get(field, "")
+                    if "word_count" in metadata_fields:
+                        metadata["word_count"] = len(content.split())
+                    response["metadata"] = metadata
+
+                return response
+            else:
+                log.warning(
+                    "      [%d] ❌ Failed: %s", index, result.get("error", "Unknown")
+                )
+                return {
+                    "success": False,
+                    "url": url,
+                    "error": result.get("error", "Unknown error"),
+                }
+
+        return {"success": False, "url": url, "error": "Invalid response"}
 
     async def fetch_single_url(
         self,
@@ -158,63 +269,22 @@ class CrawlPlugin(MCPPlugin):
         include_metadata: bool,
         timeout: int,
         index: int = 0,
+        metadata_fields: FrozenSet[str] = _METADATA_FIELDS,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         try:
-            print(f"      [{index}] Fetching: {url[:60]}...")
+            log.debug("      [%d] Fetching: %.60s...", index, url)
 
             result = await self.crawler.fetch_webpage(
-                url=url, max_length=max_length, timeout=timeout
+                url=url, max_length=max_length, timeout=timeout, use_cache=use_cache
+            )
+            return self._to_response(
+                url, result, include_metadata, index, metadata_fields
             )
-
-            if isinstance(result, dict):
-                if result.get("success") or "content" in result:
-                    content = result.get("content", "")
-                    content_length = len(content)
-
-                    if not self.validate_content(content):
-                        print(f"      [{index}] ⚠️ Invalid ({content_length} chars)")
-                        return {
-                            "success": False,
-                            "url": url,
-                            "error": f"Content too short ({content_length} chars)",
-                            "content_length": content_length,
-                        }
-
-                    print(
-                        f"      [{index}] ✅ Success ({content_length:,} chars = {content_length/1000:.1f}KB)"
-                    )
-
-                    response = {
-                        "success": True,
-                        "url": url,
-                        "content": content,
-                        "content_length": content_length,
-                    }
-
-                    if include_metadata:
-                        response["metadata"] = {
-                            "title": result.get("title", ""),
-                            "description": result.get("description", ""),
-                            "language": result.get("language", ""),
-                            "word_count": len(content.split()),
-                        }
-
-                    return response
-                else:
-                    print(
-                        f"      [{index}] ❌ Failed: {result.get('error', 'Unknown')}"
-                    )
-                    return {
-                        "success": False,
-                        "url": url,
-                        "error": result.get("error", "Unknown error"),
-                    }
-
-            return {"success": False, "url": url, "error": "Invalid response"}
 
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
-            print(f"      [{index}] ❌ Exception: {error_msg}")
+            log.warning("      [%d] ❌ Exception: %s", index, error_msg)
             return {"success": False, "url": url, "error": error_msg}
 
     async def fetch_batch(
@@ -224,30 +294,21 @@ class CrawlPlugin(MCPPlugin):
         include_metadata: bool,
         timeout: int,
         batch_size: int,
+        metadata_fields: FrozenSet[str] = _METADATA_FIELDS,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
-        all_results = []
-
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(urls) + batch_size - 1) // batch_size
-
-            print(f"   📦 Batch {batch_num}/{total_batches}: {len(batch)} URLs")
-
-            tasks = [
-                self.fetch_single_url(
-                    url, max_length, include_metadata, timeout, i + idx + 1
-                )
-                for idx, url in enumerate(batch)
-            ]
-
-            batch_results = await asyncio.gather(*tasks)
-            all_results.extend(batch_results)
+        """Fetch all URLs concurrently with at most batch_size requests in flight"""
+        log.debug("   📦 Fetching %d URLs (%d concurrent)", len(urls), batch_size)
 
-            if i + batch_size < len(urls):
-                await asyncio.sleep(0.5)
+        # 크롤러의 배치 API 사용: 전체 동시성 + 호스트별 동시성 제한을 함께 적용
+        raw_results = await self.crawler.fetch_webpages(
+            urls, max_length, timeout, concurrency=batch_size, use_cache=use_cache
+        )
 
-        return all_results
+        return [
+            self._to_response(url, result, include_metadata, idx, metadata_fields)
+            for idx, (url, result) in enumerate(zip(urls, raw_results), 1)
+        ]
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         single_url = arguments.get("url", "").strip()
@@ -255,6 +316,21 @@ class CrawlPlugin(MCPPlugin):
         limit = arguments.get("limit", 10)
         max_length = arguments.get("max_length", 20000)
         include_metadata = arguments.get("include_metadata", True)
+        metadata_fields = arguments.get("metadata_fields")
+        if metadata_fields is None:
+            metadata_fields = _METADATA_FIELDS
+        else:
+            # 문자열 하나는 한 항목 리스트로 취급 (문자 단위 교집합 방지)
+            if isinstance(metadata_fields, str):
+                metadata_fields = [metadata_fields]
+            elif not isinstance(metadata_fields, (list, tuple)) or not all(
+                isinstance(field, str) for field in metadata_fields
+            ):
+                return {
+                    "success": False,
+                    "error": "'metadata_fields' must be an array of strings",
+                }
+            metadata_fields = _METADATA_FIELDS.intersection(metadata_fields)
         timeout = arguments.get("timeout", 30)
         batch_size = arguments.get("batch_size", 10)
 
@@ -281,11 +357,32 @@ class CrawlPlugin(MCPPlugin):
             urls_to_fetch = [single_url]
             backup_urls = []
         else:
-            valid_urls = [url for url in url_list if self.validate_url(url)]
-            invalid_urls = [url for url in url_list if not self.validate_url(url)]
+            # 한 번의 순회로 유효/무효 URL 분리 + 중복 URL 제거 (순서 유지)
+            valid_urls = []
+            invalid_urls = []
+            seen_keys = set()
+            duplicate_count = 0
+            validate_url = self.validate_url
+            for url in url_list:
+                if not validate_url(url):
+                    invalid_urls.append(url)
+                    continue
+                try:
+                    key = _url_key(url)
+                except ValueError:
+                    # urlsplit이 거부하는 URL (예: "http://[x")은 건너뜀
+                    invalid_urls.append(url)
+                    continue
+                if key in seen_keys:
+                    duplicate_count += 1
+                    continue
+                seen_keys.add(key)
+                valid_urls.append(url)
 
             if invalid_urls:
                 print(f"   ⚠️ Skipping {len(invalid_urls)} invalid URLs")
+            if duplicate_count:
+                print(f"   ♻️ Skipping {duplicate_count} duplicate URLs")
 
             if not valid_urls:
                 return {"success": False, "error": "No valid URLs"}
@@ -312,12 +409,14 @@ class CrawlPlugin(MCPPlugin):
         if len(urls_to_fetch) == 1:
             results = [
                 await self.fetch_single_url(
-                    urls_to_fetch[0], max_length, include_metadata, timeout, 1
+                    urls_to_fetch[0], max_length, include_metadata, timeout, 1,
+                    metadata_fields,
                 )
             ]
         else:
             results = await self.fetch_batch(
-                urls_to_fetch, max_length, include_metadata, timeout, batch_size
+                urls_to_fetch, max_length, include_metadata, timeout, batch_size,
+                metadata_fields,
             )
 
         shortage_info = None
@@ -343,7 +442,8 @@ class CrawlPlugin(MCPPlugin):
                     print(f"   🚀 Using {len(retry_urls)} backup URLs")
 
                     retry_results = await self.fetch_batch(
-                        retry_urls, max_length, include_metadata, timeout, batch_size
+                        retry_urls, max_length, include_metadata, timeout, batch_size,
+                        metadata_fields,
                     )
 
                     for r in retry_results:
@@ -369,28 +469,36 @@ class CrawlPlugin(MCPPlugin):
                         retry_urls = failed_urls[: remaining * 2]
 
                         print(f"   🔁 Retrying {len(retry_urls)} URLs")
-                        await asyncio.sleep(3)
+                        delay = _backoff_delay(results, cap=3.0)
+                        if delay:
+                            await asyncio.sleep(delay)
 
+                        # 캐시를 우회해 실제로 다시 가져옴 (캐시된 짧은 페이지 재사용 방지)
                         retry_results = await self.fetch_batch(
                             retry_urls,
                             max_length,
                             include_metadata,
                             timeout,
                             batch_size,
+                            metadata_fields,
+                            use_cache=False,
                         )
 
+                        # URL → 실패한 결과 위치 (중복 URL은 앞에서부터 채움)
+                        failed_positions: Dict[str, List[int]] = {}
+                        for i, orig in enumerate(results):
+                            if not orig.get("success"):
+                                failed_positions.setdefault(orig["url"], []).append(i)
+
                         for r in retry_results:
                             if r.get("success") and self.validate_content(
                                 r.get("content", "")
                             ):
-                                for i, orig in enumerate(results):
-                                    if orig["url"] == r["url"] and not orig.get(
-                                        "success"
-                                    ):
-                                        results[i] = r
-                                        current_success += 1
-                                        print(f"      ✅ Recovered: {r['url'][:60]}")
-                                        break
+                                positions = failed_positions.get(r["url"])
+                                if positions:
+                                    results[positions.pop(0)] = r
+                                    current_success += 1
+                                    print(f"      ✅ Recovered: {r['url'][:60]}")
                                 if current_success >= target_count:
                                     break
 
@@ -443,21 +551,29 @@ class CrawlPlugin(MCPPlugin):
             print(f"   ✅ Total > Threshold: {total_content_size > chunk_threshold}")
             print(f"   {'🔥'*25}")
 
-            combined_content = "\n\n---PAGE SEPARATOR---\n\n".join(
-                [
-                    f"[Source: {r['url']}]\n{r.get('content', '')}"
-                    for r in results
-                    if r.get("success")
-                ]
+            # 페이지별 문자열 리스트를 만들지 않고 버퍼에 바로 기록
+            buf = io.StringIO()
+            separator = ""
+            for r in results:
+                if r.get("success"):
+                    buf.write(separator)
+                    buf.write("[Source: ")
+                    buf.write(r["url"])
+                    buf.write("]\n")
+                    buf.write(r.get("content", ""))
+                    separator = "\n\n---PAGE SEPARATOR---\n\n"
+            combined_content = buf.getvalue()
+            del buf
+
+            chunks, chunks_total_length = self._chunk_text(
+                combined_content, chunk_size, chunk_overlap
             )
-
-            chunks = self._chunk_text(combined_content, chunk_size, chunk_overlap)
             chunked = True
 
             chunk_info = {
                 "total_chunks": len(chunks),
                 "avg_chunk_size": (
-                    sum(c["length"] for c in chunks) // len(chunks) if chunks else 0
+                    chunks_total_length // len(chunks) if chunks else 0
                 ),
                 "total_original_size": total_content_size,
                 "chunk_threshold": chunk_threshold,
@@ -1,6 +1,134 @@
 from plugin_base import MCPPlugin
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import json
+import logging
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+
+try:
+    # C 기반 JSON 직렬화 (설정 지문 계산용)
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# 로그 배너 (호출마다 문자열 곱셈 방지)
+_BANNER_RUN = "🚀" * 35
+_BANNER_CHAIN = "🔗" * 35
+
+# 같은 API 호스트로 동시에 보내는 요청 상한 (브라우저 기본값과 동일)
+PER_HOST_CONCURRENCY = 4
+
+# 도구 1회 실행 시간 상한 (초) - runLLM의 HTTP 타임아웃(180초)보다 넉넉하게
+DEFAULT_TOOL_TIMEOUT = 300.0
+
+# tool_planner가 직접 처리해야 하는 도구 (executor에서 거부)
+_REJECTED = frozenset(("search", "fetch_webpage"))
+_REJECTIONS = {
+    tool: {
+        "success": False,
+        "error": f"Tool '{tool}' cannot be executed by executor",
+        "reason": f"{tool} should be handled by tool_planner directly",
+        "suggestion": f"Use tool_planner to execute {tool}",
+    }
+    for tool in _REJECTED
+}
+
+def _fingerprint(obj: Any) -> int:
+    """Stable hash of a JSON-like value (key order independent)"""
+    if orjson:
+        return hash(orjson.dumps(
+            obj,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ))
+    return hash(json.dumps(obj, sort_keys=True, default=str))
+
+
+def _timeout(value: Any) -> float:
+    """Positive timeout in seconds (anything else falls back to the default)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+        return float(value)
+    return DEFAULT_TOOL_TIMEOUT
+
+
+# 디스패치 함수가 플러그인을 찾지 못했을 때 반환하는 표식
+_NOT_FOUND = object()
+
+
+# 도구 정의용 입력 스키마 (접근마다 dict를 새로 만들지 않도록 모듈에서 한 번 생성)
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["configure", "execute", "chain", "status"],
+            "description": "Action to perform",
+        },
+        # Configure action
+        "api_credentials": {
+            "type": "object",
+            "description": "API credentials to store (for configure action)",
+        },
+        "tool_api_mappings": {
+            "type": "object",
+            "description": "Tool -> API name mappings (for configure action)",
+        },
+        "default_api": {
+            "type": "string",
+            "description": "Default API name (for configure action)",
+        },
+        # Execute action
+        "tool_name": {
+            "type": "string",
+            "description": "Tool to execute (for execute action)",
+        },
+        "arguments": {
+            "type": "object",
+            "description": "Arguments for the tool (for execute action)",
+        },
+        "passthrough_data": {
+            "type": "object",
+            "description": "Additional data to pass through (for execute action)",
+        },
+        "inject_api": {
+            "type": "boolean",
+            "default": True,
+            "description": "Whether to inject API credentials",
+        },
+        "timeout": {
+            "type": "number",
+            "default": DEFAULT_TOOL_TIMEOUT,
+            "description": "Seconds before a tool call is abandoned (for execute action)",
+        },
+        # Chain action
+        "chain": {
+            "type": "array",
+            "description": "List of tools to execute sequentially (for chain action)",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "tool_name": {"type": "string"},
+                    "arguments": {"type": "object"},
+                    "inject_api": {"type": "boolean", "default": True},
+                    "pass_result_to_next": {
+                        "type": "boolean",
+                        "default": False,
+                    },
+                    "result_key": {
+                        "type": "string",
+                        "description": "Key to store result for next tool",
+                    },
+                    "timeout": {"type": "number", "default": DEFAULT_TOOL_TIMEOUT},
+                },
+                "required": ["tool_name"],
+            },
+        },
+    },
+    "required": ["action"],
+}
 
 
 class ExecutorPlugin(MCPPlugin):
@@ -19,133 +147,136 @@ class ExecutorPlugin(MCPPlugin):
     - Centralized API management
     """
 
+    __slots__ = ("plugin_manager", "_dispatch")
+
+    name = "executor"
+    description = "Execute tools with API injection. Rejects ONLY search/fetch_webpage. Supports all other tools including runLLM."
+    input_schema = _INPUT_SCHEMA
+    version = "1.3.0"
+    author = "damin25soka7"
+
     # Class-level API storage
     _api_credentials: Dict[str, Dict[str, Any]] = {}
     _tool_api_mappings: Dict[str, str] = {}
     _default_api: str = "api1"
 
-    def __init__(self):
-        self.plugin_manager = None
+    # 도구 → (API 이름, 자격 증명) 사전 계산 결과 (configure 시 재생성)
+    _resolved: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    _resolved_default: Optional[Tuple[str, Dict[str, Any]]] = None
 
-    @property
-    def name(self) -> str:
-        return "executor"
+    # 마지막으로 적용한 설정의 지문 (동일 설정 재적용 시 건너뜀)
+    _config_fp: Optional[int] = None
 
-    @property
-    def description(self) -> str:
-        return "Execute tools with API injection. Rejects ONLY search/fetch_webpage. Supports all other tools including runLLM."
+    # status 응답 캐시 (configure 시에만 다시 만듦)
+    _status_snapshot: Optional[Dict[str, Any]] = None
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["configure", "execute", "chain", "status"],
-                    "description": "Action to perform",
-                },
-                # Configure action
-                "api_credentials": {
-                    "type": "object",
-                    "description": "API credentials to store (for configure action)",
-                },
-                "tool_api_mappings": {
-                    "type": "object",
-                    "description": "Tool -> API name mappings (for configure action)",
-                },
-                "default_api": {
-                    "type": "string",
-                    "description": "Default API name (for configure action)",
-                },
-                # Execute action
-                "tool_name": {
-                    "type": "string",
-                    "description": "Tool to execute (for execute action)",
-                },
-                "arguments": {
-                    "type": "object",
-                    "description": "Arguments for the tool (for execute action)",
-                },
-                "passthrough_data": {
-                    "type": "object",
-                    "description": "Additional data to pass through (for execute action)",
-                },
-                "inject_api": {
-                    "type": "boolean",
-                    "default": True,
-                    "description": "Whether to inject API credentials",
-                },
-                # Chain action
-                "chain": {
-                    "type": "array",
-                    "description": "List of tools to execute sequentially (for chain action)",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "tool_name": {"type": "string"},
-                            "arguments": {"type": "object"},
-                            "inject_api": {"type": "boolean", "default": True},
-                            "pass_result_to_next": {
-                                "type": "boolean",
-                                "default": False,
-                            },
-                            "result_key": {
-                                "type": "string",
-                                "description": "Key to store result for next tool",
-                            },
-                        },
-                        "required": ["tool_name"],
-                    },
-                },
-            },
-            "required": ["action"],
-        }
-
-    @property
-    def version(self) -> str:
-        return "1.3.0"
+    # API 호스트별 동시 실행 제한 (병렬 체인 단계가 한 호스트에 몰리는 것 방지)
+    # 설정된 API의 url 호스트만 키로 사용하므로 크기는 설정된 API 수로 제한됨
+    _host_semaphores: Dict[str, asyncio.Semaphore] = {}
 
-    @property
-    def author(self) -> str:
-        return "damin25soka7"
+    def __init__(self):
+        self.plugin_manager = None
+        self._dispatch = None
 
     def set_plugin_manager(self, plugin_manager):
         self.plugin_manager = plugin_manager
 
+        # 실행 경로를 한 번만 결정 (매 호출마다 hasattr 검사 방지)
+        if hasattr(plugin_manager, "call_tool"):
+            self._dispatch = plugin_manager.call_tool
+        elif hasattr(plugin_manager, "plugins"):
+
+            async def dispatch(tool_name: str, args: Dict[str, Any]) -> Any:
+                plugin = plugin_manager.plugins.get(tool_name)
+                if plugin is None:
+                    return _NOT_FOUND
+                return await plugin.execute(args)
+
+            self._dispatch = dispatch
+        else:
+            self._dispatch = None
+
     @classmethod
-    def configure_credentials(cls, config: Dict[str, Any]):
-        """Configure API credentials"""
-        cls._api_credentials = config.get("api_credentials", {})
-        cls._tool_api_mappings = config.get("tool_api_mappings", {})
-        cls._default_api = config.get("default_api", "api1")
-
-        print(f"\n{'='*70}")
-        print(f"🔧 EXECUTOR v1.3 - API Credentials Configured")
-        print(f"{'='*70}")
-        print(f"   APIs: {len(cls._api_credentials)}")
-        for api_name in cls._api_credentials.keys():
-            print(f"      ✅ {api_name}")
-        print(f"\n   Tool Mappings:")
+    def configure_credentials(cls, config: Dict[str, Any]) -> bool:
+        """Configure API credentials (returns False if the config is unchanged)"""
+        return cls._apply_credentials(
+            config.get("api_credentials", {}),
+            config.get("tool_api_mappings", {}),
+            config.get("default_api", "api1"),
+        )
+
+    @classmethod
+    def _apply_credentials(
+        cls,
+        api_credentials: Dict[str, Dict[str, Any]],
+        tool_api_mappings: Dict[str, str],
+        default_api: str,
+    ) -> bool:
+        """Store already-extracted credentials (skipped when the config is unchanged)"""
+        fingerprint = _fingerprint([api_credentials, tool_api_mappings, default_api])
+        if fingerprint == cls._config_fp:
+            log.debug("🔧 EXECUTOR - API credentials unchanged, skipping")
+            return False
+
+        cls._config_fp = fingerprint
+        cls._api_credentials = api_credentials
+        cls._tool_api_mappings = tool_api_mappings
+        cls._default_api = default_api
+
+        cls._resolved = {
+            tool: (api, cls._api_credentials[api])
+            for tool, api in cls._tool_api_mappings.items()
+            if api in cls._api_credentials
+        }
+        cls._resolved_default = (
+            (cls._default_api, cls._api_credentials[cls._default_api])
+            if cls._default_api and cls._default_api in cls._api_credentials
+            else None
+        )
+
+        log.info("🔧 EXECUTOR v1.3 - API Credentials Configured")
+        log.info("   APIs: %d", len(cls._api_credentials))
+        for api_name in cls._api_credentials:
+            log.info("      ✅ %s", api_name)
+        log.info("   Tool Mappings:")
         for tool, api in cls._tool_api_mappings.items():
-            print(f"      {tool} → {api}")
-        print(f"\n   Default: {cls._default_api}")
-        print(f"{'='*70}\n")
+            log.info("      %s → %s", tool, api)
+        log.info("   Default: %s", cls._default_api)
+
+        cls._status_snapshot = None
+        return True
+
+    @classmethod
+    def resolve_api(cls, tool_name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Get (API name, credentials) for a specific tool, falling back to default"""
+        return cls._resolved.get(tool_name, cls._resolved_default)
 
     @classmethod
     def get_api_for_tool(cls, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get API credentials for a specific tool"""
+        resolved = cls.resolve_api(tool_name)
+        return resolved[1] if resolved else None
 
-        # Try specific mapping
-        api_name = cls._tool_api_mappings.get(tool_name)
-        if api_name and api_name in cls._api_credentials:
-            return cls._api_credentials[api_name]
-
-        # Fallback to default
-        if cls._default_api and cls._default_api in cls._api_credentials:
-            return cls._api_credentials[cls._default_api]
-
-        return None
+    @classmethod
+    def _host_limit(cls, url: Any):
+        """Per-host semaphore for a configured API URL (no limit when there is no URL)"""
+        try:
+            host = urlsplit(url).netloc if isinstance(url, str) else ""
+        except ValueError:
+            host = ""
+        if not host:
+            return nullcontext()
+        semaphore = cls._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = cls._host_semaphores[host] = asyncio.Semaphore(PER_HOST_CONCURRENCY)
+        return semaphore
+
+    async def _dispatch_limited(
+        self, tool_name: str, args: Dict[str, Any], api_url: Optional[str]
+    ) -> Any:
+        """Dispatch a tool call while holding the configured API host's slot"""
+        async with self._host_limit(api_url):
+            return await self._dispatch(tool_name, args)
 
     async def execute_single_tool(
         self,
@@ -153,88 +284,69 @@ class ExecutorPlugin(MCPPlugin):
         tool_arguments: Dict[str, Any],
         inject_api: bool = True,
         passthrough_data: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_TOOL_TIMEOUT,
     ) -> Dict[str, Any]:
-        """Execute a single tool with API injection"""
+        """Execute a single tool with API injection (gives up after timeout seconds)"""
 
         if not self.plugin_manager:
             return {"success": False, "error": "Plugin manager not available"}
 
         # 🔥 Reject ONLY search and fetch_webpage
-        if tool_name == "search":
-            print(f"\n   🚫 REJECTED: search")
-            print(f"      ⚠️ search should be handled by tool_planner, not executor!")
-            return {
-                "success": False,
-                "error": "Tool 'search' cannot be executed by executor",
-                "reason": "search should be handled by tool_planner directly",
-                "suggestion": "Use tool_planner to execute search",
-            }
-
-        if tool_name == "fetch_webpage":
-            print(f"\n   🚫 REJECTED: fetch_webpage")
-            print(
-                f"      ⚠️ fetch_webpage should be handled by tool_planner, not executor!"
-            )
-            return {
-                "success": False,
-                "error": "Tool 'fetch_webpage' cannot be executed by executor",
-                "reason": "fetch_webpage should be handled by tool_planner directly",
-                "suggestion": "Use tool_planner to execute fetch_webpage",
-            }
+        if tool_name in _REJECTED:
+            log.warning("   🚫 REJECTED: %s (should be handled by tool_planner)", tool_name)
+            return dict(_REJECTIONS[tool_name])
 
-        print(f"\n   ▶️ Executing: {tool_name}")
+        log.debug("   ▶️ Executing: %s", tool_name)
 
         # Make copy to avoid modifying original
-        args = tool_arguments.copy()
+        args = dict(tool_arguments)
 
-        # 🔥 API 주입
+        # 🔥 API 주입 (원본 인자 > API 기본값 > passthrough 순)
         api_used = None
+        api_url = None
         if inject_api:
-            api_config = self.get_api_for_tool(tool_name)
+            resolved = self.resolve_api(tool_name)
 
-            if api_config:
-                api_used = self._tool_api_mappings.get(tool_name, self._default_api)
-                print(f"      🔑 API: {api_used}")
+            if resolved:
+                api_used, api_config = resolved
+                api_url = api_config.get("url")
+                log.debug("      🔑 API: %s", api_used)
 
                 # API 파라미터가 없을 때만 주입
-                if "url" not in args:
-                    args["url"] = api_config.get("url")
-                if "apiKey" not in args:
-                    args["apiKey"] = api_config.get("apiKey")
-                if "model" not in args:
-                    args["model"] = api_config.get("model")
+                for key in ("url", "apiKey", "model"):
+                    if key not in args and key in api_config:
+                        args[key] = api_config[key]
 
-                print(f"      📱 Model: {args.get('model', 'N/A')}")
+                log.debug("      📱 Model: %s", args.get("model", "N/A"))
 
         # 🔥 Passthrough data 병합
         if passthrough_data:
-            print(f"      📦 Passthrough: {len(passthrough_data)} keys")
+            log.debug("      📦 Passthrough: %d keys", len(passthrough_data))
             for key, value in passthrough_data.items():
-                if key not in args:
-                    args[key] = value
+                args.setdefault(key, value)
 
         # 실행
         try:
             result = None
 
-            if hasattr(self.plugin_manager, "call_tool"):
-                result = await self.plugin_manager.call_tool(tool_name, args)
-            elif hasattr(self.plugin_manager, "plugins"):
-                plugin = self.plugin_manager.plugins.get(tool_name)
-                if plugin:
-                    result = await plugin.execute(args)
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Plugin '{tool_name}' not found",
-                    }
-            else:
+            if self._dispatch is None:
                 return {
                     "success": False,
                     "error": "Cannot execute tool",
                 }
 
-            print(f"      ✅ Done")
+            # 호스트 슬롯 대기 시간도 timeout에 포함
+            result = await asyncio.wait_for(
+                self._dispatch_limited(tool_name, args, api_url), timeout
+            )
+
+            if result is _NOT_FOUND:
+                return {
+                    "success": False,
+                    "error": f"Plugin '{tool_name}' not found",
+                }
+
+            log.debug("      ✅ Done: %s", tool_name)
 
             return {
                 "success": True,
@@ -247,190 +359,259 @@ class ExecutorPlugin(MCPPlugin):
                 ),
             }
 
+        except asyncio.TimeoutError:
+            log.warning("      ⏱️ %s timed out after %gs", tool_name, timeout)
+            return {
+                "success": False,
+                "tool_name": tool_name,
+                "error": f"Timed out after {timeout:g}s",
+            }
+
         except Exception as e:
-            print(f"      ❌ Failed: {e}")
+            log.warning("      ❌ %s failed: %s", tool_name, e)
             return {
                 "success": False,
                 "tool_name": tool_name,
                 "error": str(e),
             }
 
-    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute action"""
-
-        action = arguments.get("action", "").lower()
+    # ============================================================
+    # ACTION: configure
+    # ============================================================
+    async def _do_configure(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Store API credentials"""
+        api_credentials = arguments.get("api_credentials", {})
+        tool_api_mappings = arguments.get("tool_api_mappings", {})
+        default_api = arguments.get("default_api", "api1")
 
-        # ============================================================
-        # ACTION: configure
-        # ============================================================
-        if action == "configure":
-            api_credentials = arguments.get("api_credentials", {})
-            tool_api_mappings = arguments.get("tool_api_mappings", {})
-            default_api = arguments.get("default_api", "api1")
-
-            if not api_credentials:
-                return {
-                    "success": False,
-                    "error": "api_credentials required for configure action",
-                }
-
-            config = {
-                "api_credentials": api_credentials,
-                "tool_api_mappings": tool_api_mappings,
-                "default_api": default_api,
+        if not api_credentials:
+            return {
+                "success": False,
+                "error": "api_credentials required for configure action",
             }
 
-            self.configure_credentials(config)
+        changed = self._apply_credentials(
+            api_credentials, tool_api_mappings, default_api
+        )
 
-            return {
+        return {
+            "success": True,
+            "message": (
+                "API credentials configured successfully"
+                if changed
+                else "API credentials unchanged"
+            ),
+            "apis_count": len(api_credentials),
+            "api_names": list(api_credentials.keys()),
+            "tool_mappings": tool_api_mappings,
+            "default_api": default_api,
+        }
+
+    # ============================================================
+    # ACTION: status
+    # ============================================================
+    async def _do_status(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Report current API configuration"""
+        cls = type(self)
+        if cls._status_snapshot is None:
+            cls._status_snapshot = {
                 "success": True,
-                "message": "API credentials configured successfully",
-                "apis_count": len(api_credentials),
-                "api_names": list(api_credentials.keys()),
-                "tool_mappings": tool_api_mappings,
-                "default_api": default_api,
+                "configured": len(cls._api_credentials) > 0,
+                "apis_count": len(cls._api_credentials),
+                "api_names": list(cls._api_credentials),
+                "tool_mappings": dict(cls._tool_api_mappings),
+                "default_api": cls._default_api,
             }
-
-        # ============================================================
-        # ACTION: status
-        # ============================================================
-        elif action == "status":
+        return dict(cls._status_snapshot)
+
+    # ============================================================
+    # ACTION: execute (single tool)
+    # ============================================================
+    async def _do_execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a single tool"""
+        tool_name = arguments.get("tool_name", "").strip()
+        tool_arguments = arguments.get("arguments", {})
+        passthrough_data = arguments.get("passthrough_data", {})
+        inject_api = arguments.get("inject_api", True)
+
+        if not tool_name:
             return {
-                "success": True,
-                "configured": len(self._api_credentials) > 0,
-                "apis_count": len(self._api_credentials),
-                "api_names": list(self._api_credentials.keys()),
-                "tool_mappings": self._tool_api_mappings,
-                "default_api": self._default_api,
+                "success": False,
+                "error": "tool_name required for execute action",
             }
 
-        # ============================================================
-        # ACTION: execute (single tool)
-        # ============================================================
-        elif action == "execute":
-            tool_name = arguments.get("tool_name", "").strip()
-            tool_arguments = arguments.get("arguments", {})
-            passthrough_data = arguments.get("passthrough_data", {})
-            inject_api = arguments.get("inject_api", True)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   %s", _BANNER_RUN)
+            log.debug("   🚀 EXECUTOR v1.3 - Single Execution")
 
-            if not tool_name:
-                return {
-                    "success": False,
-                    "error": "tool_name required for execute action",
-                }
+        result = await self.execute_single_tool(
+            tool_name,
+            tool_arguments,
+            inject_api,
+            passthrough_data,
+            _timeout(arguments.get("timeout")),
+        )
 
-            print(f"\n{'🚀'*35}")
-            print(f"   🚀 EXECUTOR v1.3 - Single Execution")
-            print(f"   {'🚀'*35}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   %s", _BANNER_RUN)
 
-            result = await self.execute_single_tool(
-                tool_name, tool_arguments, inject_api, passthrough_data
-            )
+        return result
 
-            print(f"   {'🚀'*35}\n")
+    # ============================================================
+    # ACTION: chain (multiple tools)
+    # ============================================================
+    async def _do_chain(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a chain of tools (independent steps run concurrently)"""
+        chain = arguments.get("chain", [])
 
-            return result
+        if not chain:
+            return {
+                "success": False,
+                "error": "chain array required for chain action",
+            }
 
-        # ============================================================
-        # ACTION: chain (multiple tools)
-        # ============================================================
-        elif action == "chain":
-            chain = arguments.get("chain", [])
+        # 🔥 한 번의 검증 패스로 단계를 정규화하고 그룹을 나눔
+        #    (pass_result_to_next 단계 뒤에서 새 그룹 시작, 그룹 내 단계는 서로 독립)
+        groups = [([], [])]  # (실행할 단계, 건너뛸 단계 결과)
+        for idx, step in enumerate(chain, 1):
+            tool_name = step.get("tool_name") if isinstance(step, dict) else None
+            tool_name = tool_name.strip() if isinstance(tool_name, str) else ""
 
-            if not chain:
+            if not tool_name:
                 return {
                     "success": False,
-                    "error": "chain array required for chain action",
+                    "error": f"chain step {idx}: tool_name missing",
+                    "step": idx,
                 }
 
-            print(f"\n{'🔗'*35}")
-            print(f"   🔗 EXECUTOR v1.3 - Plugin Chain")
-            print(f"   {'🔗'*35}")
-            print(f"   Steps: {len(chain)}")
-
-            results = []
-            shared_data = {}  # Data shared between steps
-
-            for idx, step in enumerate(chain, 1):
-                tool_name = step.get("tool_name", "").strip()
-                tool_arguments = step.get("arguments", {}).copy()
-                inject_api = step.get("inject_api", True)
-                pass_result_to_next = step.get("pass_result_to_next", False)
-                result_key = step.get("result_key", f"step_{idx}_result")
-
-                if not tool_name:
-                    error_result = {
-                        "success": False,
-                        "step": idx,
-                        "error": "tool_name missing",
-                    }
-                    results.append(error_result)
-                    continue
-
-                print(f"\n   📌 Step {idx}/{len(chain)}: {tool_name}")
+            pass_result_to_next = step.get("pass_result_to_next", False)
 
-                # 🔥 Check if it's search or fetch_webpage
-                if tool_name == "search" or tool_name == "fetch_webpage":
-                    print(f"      🚫 SKIPPED: {tool_name} (use tool_planner)")
-                    error_result = {
+            # 🔥 Check if it's search or fetch_webpage
+            if tool_name in _REJECTED:
+                groups[-1][1].append(
+                    {
                         "success": False,
                         "step": idx,
                         "tool_name": tool_name,
                         "error": f"{tool_name} should be handled by tool_planner",
                     }
-                    results.append(error_result)
-                    continue
+                )
+            else:
+                groups[-1][0].append(
+                    (
+                        idx,
+                        tool_name,
+                        step.get("arguments", {}),
+                        step.get("inject_api", True),
+                        pass_result_to_next,
+                        step.get("result_key") or f"step_{idx}_result",
+                        _timeout(step.get("timeout")),
+                    )
+                )
 
-                # 🔥 Merge shared data from previous steps
-                if shared_data:
-                    print(f"      📥 Shared data: {list(shared_data.keys())}")
-                    for key, value in shared_data.items():
-                        if key not in tool_arguments:
-                            tool_arguments[key] = value
-
-                # Execute
-                result = await self.execute_single_tool(
-                    tool_name, tool_arguments, inject_api, None
+            if pass_result_to_next:
+                groups.append(([], []))
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   %s", _BANNER_CHAIN)
+            log.debug("   🔗 EXECUTOR v1.3 - Plugin Chain (%d steps)", len(chain))
+
+        results = []
+        shared_data = {}  # Data shared between steps
+
+        for pending, skipped in groups:
+            for error_result in skipped:
+                log.warning(
+                    "      🚫 SKIPPED: %s (use tool_planner)", error_result["tool_name"]
                 )
+            results.extend(skipped)
 
-                results.append(
-                    {
-                        "step": idx,
-                        "tool_name": tool_name,
-                        "success": result.get("success", False),
-                        "result": result,
-                    }
+            if not pending:
+                continue
+
+            if log.isEnabledFor(logging.DEBUG):
+                for idx, tool_name, *_ in pending:
+                    log.debug("   📌 Step %d/%d: %s", idx, len(chain), tool_name)
+                if shared_data:
+                    log.debug("      📥 Shared data: %s", list(shared_data))
+
+            # 🔥 그룹 내 독립 단계는 병렬 실행 (이전 그룹의 결과는 단계 인자에 없는 키만 채움)
+            group_results = await asyncio.gather(
+                *(
+                    self.execute_single_tool(
+                        tool_name,
+                        {**shared_data, **tool_arguments} if shared_data else tool_arguments,
+                        inject_api,
+                        None,
+                        timeout,
+                    )
+                    for _, tool_name, tool_arguments, inject_api, _, _, timeout in pending
                 )
+            )
+
+            failed_idx = None
+            for step, result in zip(pending, group_results):
+                idx, tool_name, _, _, pass_result_to_next, result_key, _ = step
+
+                # 실행 결과 dict에 단계 번호만 추가 (래퍼 dict 생성 없음)
+                result["step"] = idx
+                result.setdefault("tool_name", tool_name)
+                results.append(result)
 
                 # 🔥 Pass result to next step if requested
                 if pass_result_to_next and result.get("success"):
                     shared_data[result_key] = result.get("result")
-                    print(f"      📤 Saved to shared_data['{result_key}']")
+                    log.debug("      📤 Saved to shared_data['%s']", result_key)
 
-                # Stop chain if step failed
-                if not result.get("success"):
-                    print(f"\n   ❌ Chain stopped at step {idx} due to failure")
-                    break
+                if not result.get("success") and failed_idx is None:
+                    failed_idx = idx
 
-            print(f"\n   {'🔗'*35}")
-            print(f"   ✅ Chain complete: {len(results)}/{len(chain)} steps executed")
-            print(f"   {'🔗'*35}\n")
+            # Stop chain if step failed
+            if failed_idx is not None:
+                log.warning("   ❌ Chain stopped at step %d due to failure", failed_idx)
+                break
 
-            return {
-                "success": True,
-                "action": "chain",
-                "total_steps": len(chain),
-                "executed_steps": len(results),
-                "results": results,
-                "shared_data_keys": list(shared_data.keys()),
-            }
+        results.sort(key=lambda r: r["step"])
 
-        # ============================================================
-        # INVALID ACTION
-        # ============================================================
-        else:
+        log.info(
+            "   ✅ Chain complete: %d/%d steps executed", len(results), len(chain)
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   %s", _BANNER_CHAIN)
+
+        return {
+            "success": True,
+            "action": "chain",
+            "total_steps": len(chain),
+            "executed_steps": len(results),
+            "results": results,
+            "shared_data_keys": list(shared_data.keys()),
+        }
+
+    # action → 처리 메서드
+    _ACTIONS = {
+        "configure": _do_configure,
+        "execute": _do_execute,
+        "chain": _do_chain,
+        "status": _do_status,
+    }
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute action"""
+
+        action = arguments.get("action") or ""
+
+        # 대부분 소문자로 들어오므로 lower()는 정확히 일치하지 않을 때만 호출
+        handler = self._ACTIONS.get(action)
+        if handler is None:
+            action = action.lower()
+            handler = self._ACTIONS.get(action)
+
+        if handler is None:
             return {
                 "success": False,
                 "error": f"Invalid action: '{action}'",
                 "valid_actions": ["configure", "execute", "chain", "status"],
             }
+
+        return await handler(self, arguments)
@@ -1,7 +1,55 @@
 from plugin_base import MCPPlugin
-from typing import Dict, Any, List
+from api_table import build_api_table
+from typing import Dict, Any, List, Optional
 import httpx
+import importlib.util
 import json
+import re
+
+try:
+    # C 기반 JSON 직렬화 (리서치 모드의 큰 messages 페이로드에서 stdlib json보다 수 배 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 requires the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 리서치 모드 자동 감지 키워드 (한 번의 대소문자 무시 스캔으로 모든 키워드 검사)
+_RESEARCH_KEYWORDS = (
+    "research",
+    "comprehensive",
+    "detailed analysis",
+    "in-depth",
+    "thorough",
+    "extensive",
+    "complete analysis",
+    "full report",
+)
+_RESEARCH_RE = re.compile("|".join(map(re.escape, _RESEARCH_KEYWORDS)), re.IGNORECASE)
+
+# 허용되는 메시지 role
+_VALID_ROLES = frozenset(("user", "assistant", "system"))
+
+
+def _validate_messages(messages: Any) -> Optional[str]:
+    """Check the chat messages array; returns an error message or None if valid"""
+    if not messages or not isinstance(messages, list):
+        return "Invalid messages: must be non-empty array"
+
+    for i, msg in enumerate(messages):
+        if not isinstance(msg, dict):
+            return f"Message {i} must be an object"
+        role = msg.get("role")
+        content = msg.get("content")
+        if role is None or content is None:
+            return f"Message {i} missing role or content"
+        if not isinstance(role, str) or role not in _VALID_ROLES:
+            return f"Message {i} invalid role: {role}"
+        if not isinstance(content, str):
+            return f"Message {i} content must be a string"
+
+    return None
 
 
 class MCPAIAccessPlugin(MCPPlugin):
@@ -20,6 +68,11 @@ class MCPAIAccessPlugin(MCPPlugin):
     _custom_apis = {}
     _plugin_mappings = {}
     _default_api = None
+    # 플러그인 이름 → 해석된 API 설정 (configure_apis() 호출 시 초기화)
+    _resolved_apis: Dict[str, Dict[str, Any]] = {}
+
+    # LLM 호출이 공유하는 keep-alive 커넥션 풀 (첫 호출 시 생성)
+    _client: Optional[httpx.AsyncClient] = None
 
     @property
     def name(self) -> str:
@@ -64,6 +117,27 @@ class MCPAIAccessPlugin(MCPPlugin):
     def author(self) -> str:
         return "damin25soka7"
 
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Shared HTTP client (created lazily, reused across calls)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(180.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+                http2=HTTP2_AVAILABLE,
+            )
+        return cls._client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        client, MCPAIAccessPlugin._client = MCPAIAccessPlugin._client, None
+        if client is not None:
+            await client.aclose()
+
     @classmethod
     def configure_apis(cls, config: Dict[str, Any]):
         """
@@ -84,27 +158,10 @@ class MCPAIAccessPlugin(MCPPlugin):
             "default": "customAPI1"
         }
         """
-        cls._custom_apis = {}
-
-        apis = config.get("apis", {})
-        for api_name, api_config in apis.items():
-            if not api_name.startswith("customAPI"):
-                continue
-
-            url = api_config.get("url", "").strip()
-            api_key = api_config.get("apiKey", "").strip()
-            model = api_config.get("model", "").strip()
-
-            if url and api_key and model:
-                cls._custom_apis[api_name] = {
-                    "url": url,
-                    "apiKey": api_key,
-                    "model": model,
-                    "name": api_name,
-                }
-
-        cls._plugin_mappings = config.get("plugin_mappings", {})
-        cls._default_api = config.get("default", "customAPI1")
+        cls._custom_apis, cls._plugin_mappings, cls._default_api = build_api_table(
+            config
+        )
+        cls._resolved_apis = {}
 
         if cls._default_api not in cls._custom_apis and cls._custom_apis:
             cls._default_api = list(cls._custom_apis.keys())[0]
@@ -115,48 +172,38 @@ class MCPAIAccessPlugin(MCPPlugin):
 
     @classmethod
     def get_api_for_plugin(cls, plugin_name: str) -> Optional[Dict[str, Any]]:
-        """Get API configuration for a plugin"""
+        """Get API configuration for a plugin (resolved once per configure_apis call)"""
+        api_config = cls._resolved_apis.get(plugin_name)
+        if api_config is not None:
+            return api_config
+
         if not cls._custom_apis:
             return None
 
         # Try plugin-specific mapping
         api_name = cls._plugin_mappings.get(plugin_name)
         if api_name and api_name in cls._custom_apis:
-            return cls._custom_apis[api_name]
+            api_config = cls._custom_apis[api_name]
 
         # Fallback to default
-        if cls._default_api and cls._default_api in cls._custom_apis:
-            return cls._custom_apis[cls._default_api]
-
-        return None
-
-    def detect_research_mode(self, messages: List[Dict[str, Any]]) -> bool:
-        """Auto-detect research mode from messages"""
-        research_keywords = [
-            "research",
-            "comprehensive",
-            "detailed analysis",
-            "in-depth",
-            "thorough",
-            "extensive",
-            "complete analysis",
-            "full report",
-        ]
-
-        total_content_length = 0
-
-        for msg in messages:
-            content = msg.get("content", "").lower()
-            total_content_length += len(content)
-
-            for keyword in research_keywords:
-                if keyword in content:
-                    return True
-
-        if total_content_length > 30000:
+        elif cls._default_api and cls._default_api in cls._custom_apis:
+            api_config = cls._custom_apis[cls._default_api]
+
+        if api_config is not None:
+            cls._resolved_apis[plugin_name] = api_config
+        return api_config
+
+    def detect_research_mode(
+        self, messages: List[Dict[str, Any]], total_length: Optional[int] = None
+    ) -> bool:
+        """Auto-detect research mode from messages (total_length: precomputed content length)"""
+        if total_length is None:
+            total_length = sum(len(msg.get("content", "")) for msg in messages)
+
+        if total_length > 30000:
             return True
 
-        return False
+        return any(_RESEARCH_RE.search(msg.get("content", "")) for msg in messages)
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute LLM API call with adaptive token limits"""
@@ -168,9 +215,12 @@ class MCPAIAccessPlugin(MCPPlugin):
         if url_direct and api_key_direct and model_direct:
             print("   ℹ️ Using direct API credentials")
             url = url_direct
-            api_key = api_key_direct
             model = model_direct
             api_name = "direct"
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key_direct}",
+            }
         else:
             print("   ℹ️ Using shared customAPI config")
 
@@ -184,35 +234,20 @@ class MCPAIAccessPlugin(MCPPlugin):
                 }
 
             url = api_config["url"]
-            api_key = api_config["apiKey"]
             model = api_config["model"]
+            headers = api_config["headers"]
             api_name = api_config.get("name", "unknown")
             print(f"   ✅ Using {api_name}")
 
         messages = arguments.get("messages", [])
         research_mode_explicit = arguments.get("research_mode", False)
 
-        if not messages or not isinstance(messages, list):
-            return {
-                "success": False,
-                "message": "Invalid messages: must be non-empty array",
-            }
-
-        for i, msg in enumerate(messages):
-            if not isinstance(msg, dict):
-                return {"success": False, "message": f"Message {i} must be an object"}
-            if "role" not in msg or "content" not in msg:
-                return {
-                    "success": False,
-                    "message": f"Message {i} missing role or content",
-                }
-            if msg["role"] not in ["user", "assistant", "system"]:
-                return {
-                    "success": False,
-                    "message": f'Message {i} invalid role: {msg["role"]}',
-                }
+        error = _validate_messages(messages)
+        if error:
+            return {"success": False, "message": error}
 
-        research_mode_auto = self.detect_research_mode(messages)
+        total_input_chars = sum(len(msg.get("content", "")) for msg in messages)
+        research_mode_auto = self.detect_research_mode(messages, total_input_chars)
         research_mode = research_mode_explicit or research_mode_auto
 
         if research_mode:
@@ -226,7 +261,6 @@ class MCPAIAccessPlugin(MCPPlugin):
             mode_label = "💬 STANDARD MODE"
             mode_reason = "default"
 
-        total_input_chars = sum(len(msg.get("content", "")) for msg in messages)
         estimated_input_tokens = total_input_chars // 4
 
         print(f"\n{'='*70}")
@@ -240,11 +274,6 @@ class MCPAIAccessPlugin(MCPPlugin):
         print(f"{'='*70}")
 
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}",
-            }
-
             payload = {
                 "model": model,
                 "messages": messages,
@@ -252,72 +281,77 @@ class MCPAIAccessPlugin(MCPPlugin):
                 "max_tokens": max_tokens,
             }
 
-            async with httpx.AsyncClient(timeout=180.0) as client:
+            client = self.get_client()
+            if orjson:
+                response = await client.post(
+                    url, headers=headers, content=orjson.dumps(payload)
+                )
+            else:
                 response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-
-                if "choices" in data and len(data["choices"]) > 0:
-                    content = data["choices"][0]["message"]["content"]
-                    usage = data.get("usage", {})
-
-                    total_tokens = usage.get("total_tokens", 0)
-                    prompt_tokens = usage.get("prompt_tokens", 0)
-                    completion_tokens = usage.get("completion_tokens", 0)
-
-                    print(f"\n✅ Success!")
-                    print(f"   Output: {len(content):,} chars")
-                    print(f"\n   📊 Token Usage:")
-                    print(f"   ┌─────────────────────────────────┐")
-                    print(f"   │ Input:    {prompt_tokens:>6,} / 15,000 │")
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson else response.json()
+
+            if "choices" in data and len(data["choices"]) > 0:
+                content = data["choices"][0]["message"]["content"]
+                usage = data.get("usage", {})
+
+                total_tokens = usage.get("total_tokens", 0)
+                prompt_tokens = usage.get("prompt_tokens", 0)
+                completion_tokens = usage.get("completion_tokens", 0)
+
+                print(f"\n✅ Success!")
+                print(f"   Output: {len(content):,} chars")
+                print(f"\n   📊 Token Usage:")
+                print(f"   ┌─────────────────────────────────┐")
+                print(f"   │ Input:    {prompt_tokens:>6,} / 15,000 │")
+                print(
+                    f"   │ Output:   {completion_tokens:>6,} / {max_tokens:>6,} │"
+                )
+                print(f"   │ Total:    {total_tokens:>6,}         │")
+                print(f"   └─────────────────────────────────┘")
+
+                if prompt_tokens > 13500:
+                    print(f"   ⚠️ Input near limit ({prompt_tokens:,}/15,000)")
+                if completion_tokens > max_tokens * 0.9:
                     print(
-                        f"   │ Output:   {completion_tokens:>6,} / {max_tokens:>6,} │"
-                    )
-                    print(f"   │ Total:    {total_tokens:>6,}         │")
-                    print(f"   └─────────────────────────────────┘")
-
-                    if prompt_tokens > 13500:
-                        print(f"   ⚠️ Input near limit ({prompt_tokens:,}/15,000)")
-                    if completion_tokens > max_tokens * 0.9:
-                        print(
-                            f"   ⚠️ Output near limit ({completion_tokens:,}/{max_tokens:,})"
-                        )
-
-                    print(f"{'='*70}\n")
-
-                    return {
-                        "success": True,
-                        "message": content,
-                        "model_used": model,
-                        "api_used": api_name,
-                        "tokens": {
-                            "total": total_tokens,
-                            "input": prompt_tokens,
-                            "output": completion_tokens,
-                            "input_limit": 15000,
-                            "output_limit": max_tokens,
-                        },
-                        "research_mode": research_mode,
-                    }
-
-                elif "content" in data:
-                    content = data["content"]
-                    print(f"\n✅ Success ({len(content):,} chars)")
-                    print(f"{'='*70}\n")
-
-                    return {
-                        "success": True,
-                        "message": content,
-                        "model_used": model,
-                        "api_used": api_name,
-                        "research_mode": research_mode,
-                    }
-
-                else:
-                    raise ValueError(
-                        f"Unexpected API response format: {list(data.keys())}"
+                        f"   ⚠️ Output near limit ({completion_tokens:,}/{max_tokens:,})"
                     )
 
+                print(f"{'='*70}\n")
+
+                return {
+                    "success": True,
+                    "message": content,
+                    "model_used": model,
+                    "api_used": api_name,
+                    "tokens": {
+                        "total": total_tokens,
+                        "input": prompt_tokens,
+                        "output": completion_tokens,
+                        "input_limit": 15000,
+                        "output_limit": max_tokens,
+                    },
+                    "research_mode": research_mode,
+                }
+
+            elif "content" in data:
+                content = data["content"]
+                print(f"\n✅ Success ({len(content):,} chars)")
+                print(f"{'='*70}\n")
+
+                return {
+                    "success": True,
+                    "message": content,
+                    "model_used": model,
+                    "api_used": api_name,
+                    "research_mode": research_mode,
+                }
+
+            else:
+                raise ValueError(
+                    f"Unexpected API response format: {list(data.keys())}"
+                )
+
         except httpx.HTTPStatusError as e:
             error_text = e.response.text[:500]
             error_msg = f"HTTP {e.response.status_code}: {error_text}"
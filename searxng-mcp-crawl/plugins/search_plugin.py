@@ -1,7 +1,47 @@
 from plugin_base import MCPPlugin
-from typing import Dict, Any, List
-from crawler import WebCrawler
+from typing import Dict, Any, List, Tuple
+from crawler import get_crawler
 import asyncio
+import logging
+import time
+
+log = logging.getLogger(__name__)
+
+# execute() 인자 기본값 (한 번의 병합으로 모든 값 결정)
+_DEFAULTS = {
+    "query": "",
+    "limit": 10,
+    "category": "general",
+    "language": "auto",
+    "time_range": "",
+    "safe_search": 1,
+}
+MAX_LIMIT = 60
+
+# 병렬 검색 시 동시에 SearXNG로 보내는 배치 수 (너무 많으면 CAPTCHA 유발)
+MAX_PARALLEL_BATCHES = 3
+
+
+def _clamp_limit(value: Any) -> int:
+    """Coerce limit to an int in [1, MAX_LIMIT] (invalid values fall back to the default)"""
+    if not isinstance(value, int):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return _DEFAULTS["limit"]
+    return 1 if value < 1 else MAX_LIMIT if value > MAX_LIMIT else value
+
+
+# search 도구 입력 스키마
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "limit": {"type": "integer", "default": 10},
+        "category": {"type": "string", "default": "general"},
+    },
+    "required": ["query"],
+}
 
 
 class SearchPlugin(MCPPlugin):
@@ -19,41 +59,27 @@ class SearchPlugin(MCPPlugin):
     - 🔥 CAPTCHA detection and retry
     """
 
+    __slots__ = ("crawler", "_batch_semaphore")
+
+    name = "search"
+    description = "High-performance web search via SearXNG. Params: query, limit=10 (max: 60), category=general."
+    input_schema = _INPUT_SCHEMA
+    version = "3.0.1"  # 🔥 CAPTCHA retry version
+    author = "damin25soka7"
+
     def __init__(self):
+        self._batch_semaphore = asyncio.Semaphore(MAX_PARALLEL_BATCHES)
         try:
-            self.crawler = WebCrawler()
-            print("   🔍 SearchPlugin: Crawler initialized")
+            self.crawler = get_crawler()
+            log.info("   🔍 SearchPlugin: Crawler initialized")
         except Exception as e:
-            print(f"   ⚠️ SearchPlugin: Crawler init error: {e}")
+            log.warning("   ⚠️ SearchPlugin: Crawler init error: %s", e)
             self.crawler = None
 
-    @property
-    def name(self) -> str:
-        return "search"
-
-    @property
-    def description(self) -> str:
-        return "High-performance web search via SearXNG. Params: query, limit=10 (max: 60), category=general."
-
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {"type": "string"},
-                "limit": {"type": "integer", "default": 10},
-                "category": {"type": "string", "default": "general"},
-            },
-            "required": ["query"],
-        }
-
-    @property
-    def version(self) -> str:
-        return "3.0.1"  # 🔥 CAPTCHA retry version
-
-    @property
-    def author(self) -> str:
-        return "damin25soka7"
+    async def warmup(self) -> None:
+        """Open the SearXNG connection before the first request"""
+        if self.crawler:
+            await self.crawler.warmup()
 
     async def search_batch(
         self,
@@ -68,23 +94,29 @@ class SearchPlugin(MCPPlugin):
     ) -> Dict[str, Any]:
         """Search a single batch in parallel"""
         try:
-            print(
-                f"      📦 Batch {batch_num}/{total_batches}: Fetching {batch_size} results..."
+            log.debug(
+                "      📦 Batch %d/%d: Fetching %d results...",
+                batch_num,
+                total_batches,
+                batch_size,
             )
 
-            results = await self.crawler.search_searxng(
-                query=query,
-                limit=batch_size,
-                category=category,
-                language=language,
-                time_range=time_range,
-                safe_search=safe_search,
-            )
+            async with self._batch_semaphore:
+                results = await self.crawler.search_searxng(
+                    query=query,
+                    limit=batch_size,
+                    category=category,
+                    language=language,
+                    time_range=time_range,
+                    safe_search=safe_search,
+                )
 
             if isinstance(results, dict):
                 if results.get("success") is False:
-                    print(
-                        f"      ❌ Batch {batch_num} failed: {results.get('error', 'Unknown')}"
+                    log.warning(
+                        "      ❌ Batch %d failed: %s",
+                        batch_num,
+                        results.get("error", "Unknown"),
                     )
                     return {
                         "success": False,
@@ -98,11 +130,11 @@ class SearchPlugin(MCPPlugin):
             else:
                 result_list = []
 
-            print(f"      ✅ Batch {batch_num}: {len(result_list)} results")
+            log.debug("      ✅ Batch %d: %d results", batch_num, len(result_list))
             return {"success": True, "results": result_list}
 
         except Exception as e:
-            print(f"      ❌ Batch {batch_num} error: {str(e)[:50]}")
+            log.warning("      ❌ Batch %d error: %.50s", batch_num, e)
             return {"success": False, "results": [], "error": str(e)}
 
     async def search_parallel(
@@ -113,68 +145,89 @@ class SearchPlugin(MCPPlugin):
         language: str,
         time_range: str,
         safe_search: int,
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Search with parallel batch processing for high volume
 
-        Splits large searches into batches and runs them concurrently
+        Splits large searches into batches and runs them concurrently.
+        Results are deduplicated by URL as batches complete; remaining
+        batches are cancelled once `limit` unique results are collected.
+        Returns (unique results, raw result count before deduplication).
         """
         # SearXNG typically returns ~10 results per page
         # For 60 results, we need 6 batches of 10
         batch_size = 10
         num_batches = (limit + batch_size - 1) // batch_size
 
-        print(f"\n   🚀 Parallel Search Mode")
-        print(f"   🎯 Target: {limit} results")
-        print(f"   📦 Batches: {num_batches} × {batch_size} results")
-        print(f"   {'='*50}")
+        log.debug(
+            "   🚀 Parallel Search Mode\n   🎯 Target: %d results\n   📦 Batches: %d × %d results",
+            limit,
+            num_batches,
+            batch_size,
+        )
 
         # Create batch tasks
         tasks = []
         for i in range(num_batches):
             batch_limit = min(batch_size, limit - (i * batch_size))
             if batch_limit > 0:
-                task = self.search_batch(
-                    query,
-                    batch_limit,
-                    category,
-                    language,
-                    time_range,
-                    safe_search,
-                    i + 1,
-                    num_batches,
+                task = asyncio.create_task(
+                    self.search_batch(
+                        query,
+                        batch_limit,
+                        category,
+                        language,
+                        time_range,
+                        safe_search,
+                        i + 1,
+                        num_batches,
+                    )
                 )
                 tasks.append(task)
 
         # Execute all batches in parallel
-        import time
-
         start_time = time.time()
 
-        batch_results = await asyncio.gather(*tasks)
-
-        elapsed = time.time() - start_time
-
-        # Combine results from all batches
-        all_results = []
+        # 🔥 완료되는 순서대로 URL 기준 중복 제거, limit을 채우면 남은 배치 취소
+        unique_by_url = {}
+        raw_count = 0
         successful_batches = 0
         failed_batches = 0
 
-        for batch_result in batch_results:
-            if batch_result.get("success"):
-                all_results.extend(batch_result.get("results", []))
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                batch_result = await next_batch
+                if not batch_result.get("success"):
+                    failed_batches += 1
+                    continue
+
                 successful_batches += 1
-            else:
-                failed_batches += 1
+                batch_results = batch_result.get("results", [])
+                raw_count += len(batch_results)
+                for result in batch_results:
+                    url = result.get("url")
+                    if url:
+                        unique_by_url.setdefault(url, result)
+
+                if len(unique_by_url) >= limit:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        print(f"   {'='*50}")
-        print(f"   ⏱️ Parallel execution: {elapsed:.2f}s")
-        print(f"   ✅ Successful batches: {successful_batches}/{num_batches}")
+        elapsed = time.time() - start_time
+
+        log.debug(
+            "   ⏱️ Parallel execution: %.2fs\n   ✅ Successful batches: %d/%d\n   📊 Unique results: %d",
+            elapsed,
+            successful_batches,
+            num_batches,
+            len(unique_by_url),
+        )
         if failed_batches > 0:
-            print(f"   ⚠️ Failed batches: {failed_batches}/{num_batches}")
-        print(f"   📊 Total unique results: {len(all_results)}")
+            log.warning("   ⚠️ Failed batches: %d/%d", failed_batches, num_batches)
 
-        return all_results
+        return list(unique_by_url.values()), raw_count
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -198,12 +251,12 @@ class SearchPlugin(MCPPlugin):
                 "performance": {...}
             }
         """
-        query = arguments.get("query", "").strip()
-        limit = arguments.get("limit", 10)
-        category = arguments.get("category", "general")
-        language = arguments.get("language", "auto")
-        time_range = arguments.get("time_range", "")
-        safe_search = arguments.get("safe_search", 1)
+        args = {**_DEFAULTS, **arguments}
+        query = (args["query"] or "").strip()
+        category = args["category"]
+        language = args["language"]
+        time_range = args["time_range"]
+        safe_search = args["safe_search"]
 
         # Validation
         if not query:
@@ -215,30 +268,28 @@ class SearchPlugin(MCPPlugin):
             }
 
         # Clamp limit to valid range (now supports up to 60)
-        limit = max(1, min(60, limit))
-
-        print(f"\n🔍 search v3.0.1 (High-Performance + CAPTCHA Retry)")
-        print(f"   Query: '{query}'")
-        print(f"   Limit: {limit} results")
-        print(f"   Category: {category}")
-        if language != "auto":
-            print(f"   Language: {language}")
-        if time_range:
-            print(f"   Time range: {time_range}")
+        limit = _clamp_limit(args["limit"])
 
-        import time
+        log.info(
+            "🔍 search v3.0.1: '%s' (limit=%d, category=%s, language=%s, time_range=%s)",
+            query,
+            limit,
+            category,
+            language,
+            time_range or "-",
+        )
 
         start_time = time.time()
 
         try:
             # Use parallel search for large requests (>15 results)
             if limit > 15:
-                result_list = await self.search_parallel(
+                result_list, result_count = await self.search_parallel(
                     query, limit, category, language, time_range, safe_search
                 )
             else:
                 # Single request for small searches
-                print(f"\n   🔍 Single Search Mode")
+                log.debug("   🔍 Single Search Mode")
 
                 # 🔥 First attempt with original settings
                 results = await self.crawler.search_searxng(
@@ -253,13 +304,11 @@ class SearchPlugin(MCPPlugin):
                 # Check if results were successful
                 if isinstance(results, dict) and results.get("success") is False:
                     error_msg = results.get("error", "Unknown error")
-                    print(f"   ⚠️ First attempt failed: {error_msg}")
+                    log.warning("   ⚠️ First attempt failed: %s", error_msg)
 
                     # 🔥 CAPTCHA detected? Try with different language (avoid kr-kr)
                     if "captcha" in error_msg.lower() or "kl" in error_msg.lower():
-                        print(
-                            f"   🔄 CAPTCHA detected, retrying with language='en-US'..."
-                        )
+                        log.info("   🔄 CAPTCHA detected, retrying with language='en-US'...")
 
                         # Retry with English to avoid regional blocks
                         results = await self.crawler.search_searxng(
@@ -276,7 +325,7 @@ class SearchPlugin(MCPPlugin):
                             and results.get("success") is False
                         ):
                             error_msg = results.get("error", "Unknown error")
-                            print(f"   ❌ Retry also failed: {error_msg}")
+                            log.warning("   ❌ Retry also failed: %s", error_msg)
 
                             # 🔥 Return structured error with query info
                             return {
@@ -295,7 +344,7 @@ class SearchPlugin(MCPPlugin):
                                 "captcha_blocked": True,
                             }
                         else:
-                            print(f"   ✅ Retry succeeded with en-US!")
+                            log.info("   ✅ Retry succeeded with en-US!")
                     else:
                         # Non-CAPTCHA error
                         return {
@@ -317,37 +366,34 @@ class SearchPlugin(MCPPlugin):
                 result_list = (
                     results if isinstance(results, list) else results.get("results", [])
                 )
+                result_count = len(result_list)
 
-            elapsed_time = time.time() - start_time
-            result_count = len(result_list)
+                # Remove duplicates by URL (dict 삽입 순서 유지, 첫 결과 우선)
+                # (병렬 모드는 search_parallel에서 이미 중복 제거됨)
+                unique_by_url = {}
+                for result in result_list:
+                    url = result.get("url")
+                    if url:
+                        unique_by_url.setdefault(url, result)
+                result_list = list(unique_by_url.values())
 
-            # Remove duplicates by URL
-            unique_results = []
-            seen_urls = set()
-            for result in result_list:
-                url = result.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_results.append(result)
+            elapsed_time = time.time() - start_time
+            unique_results = result_list
 
             unique_count = len(unique_results)
 
             # 🔥 Zero result warning
             if unique_count == 0:
-                print(f"\n   {'⚠️'*25}")
-                print(f"   ⚠️ ZERO RESULTS WARNING")
-                print(f"   📊 Query: '{query}'")
-                print(f"   💡 No results found - possible CAPTCHA or blocking")
-                print(f"   {'⚠️'*25}\n")
-
-            print(f"\n   {'='*50}")
-            print(f"   {'✅' if unique_count > 0 else '⚠️'} Search Complete!")
-            print(f"   📊 Raw results: {result_count}")
-            print(f"   🎯 Unique results: {unique_count}")
-            print(f"   ⏱️ Total time: {elapsed_time:.2f}s")
-            if unique_count > 0 and elapsed_time > 0:
-                print(f"   🚀 Speed: {unique_count/elapsed_time:.1f} results/sec")
-            print(f"   {'='*50}\n")
+                log.warning(
+                    "   ⚠️ ZERO RESULTS for '%s' - possible CAPTCHA or blocking", query
+                )
+
+            log.info(
+                "   ✅ Search complete: %d unique / %d raw results in %.2fs",
+                unique_count,
+                result_count,
+                elapsed_time,
+            )
 
             return {
                 "success": True,
@@ -377,7 +423,7 @@ class SearchPlugin(MCPPlugin):
 
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
-            print(f"   ❌ Error: {error_msg}")
+            log.error("   ❌ Error: %s", error_msg)
 
             return {
                 "success": False,
@@ -5,6 +5,16 @@ import json
 import asyncio
 import re
 
+# 🔥 LLM 응답 정리용 정규식 (호출마다 컴파일하지 않도록 모듈 로드 시 한 번만)
+_LINE_COMMENT_RE = re.compile(r"//.*?\n")
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+# 언어 감지용 문자 범위 (문자마다 ord() 비교 대신 C 레벨 정규식 스캔)
+_HANGUL_RE = re.compile("[\uac00-\ud7a3]")
+_JAPANESE_RE = re.compile("[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff]")
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
 
 class ToolPlannerPlugin(MCPPlugin):
     """
@@ -21,6 +31,10 @@ class ToolPlannerPlugin(MCPPlugin):
     - Executor-ready output
     """
 
+    # 🔥 Planner LLM 호출용 keep-alive 커넥션 풀 (인스턴스가 아닌 클래스에 두어
+    # plugins/reload로 인스턴스가 재생성되어도 풀이 새로 열리지 않음, 첫 호출 시 생성)
+    _client: Optional[httpx.AsyncClient] = None
+
     def __init__(self):
         self.plugin_manager = None
         self._search_failure_count = {}
@@ -80,6 +94,22 @@ class ToolPlannerPlugin(MCPPlugin):
     def author(self) -> str:
         return "damin25soka7"
 
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Shared HTTP client (created lazily, reused across calls and reloads)"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=120.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return cls._client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        client, ToolPlannerPlugin._client = ToolPlannerPlugin._client, None
+        if client is not None:
+            await client.aclose()
+
     def set_plugin_manager(self, plugin_manager):
         self.plugin_manager = plugin_manager
 
@@ -127,39 +157,38 @@ class ToolPlannerPlugin(MCPPlugin):
             try:
                 print(f"   📡 API call attempt {attempt}/3...")
 
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    response = await client.post(url, headers=headers, json=payload)
+                response = await self.get_client().post(url, headers=headers, json=payload)
 
-                    if response.status_code in [403, 429, 503]:
-                        error_text = response.text[:200]
-                        wait_time = attempt * 3
+                if response.status_code in [403, 429, 503]:
+                    error_text = response.text[:200]
+                    wait_time = attempt * 3
 
-                        print(f"   ⚠️ HTTP {response.status_code}: {error_text}")
+                    print(f"   ⚠️ HTTP {response.status_code}: {error_text}")
 
-                        if attempt < 3:
-                            print(f"   ⏳ Waiting {wait_time}s before retry...")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            raise httpx.HTTPStatusError(
-                                f"HTTP {response.status_code} after 3 attempts",
-                                request=response.request,
-                                response=response,
-                            )
-
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if "choices" in data and len(data["choices"]) > 0:
-                        content = data["choices"][0]["message"]["content"]
-                        print(f"   ✅ API call successful (attempt {attempt})")
-                        return content
-                    elif "content" in data:
-                        content = data["content"]
-                        print(f"   ✅ API call successful (attempt {attempt})")
-                        return content
+                    if attempt < 3:
+                        print(f"   ⏳ Waiting {wait_time}s before retry...")
+                        await asyncio.sleep(wait_time)
+                        continue
                     else:
-                        raise ValueError(f"Unexpected response format")
+                        raise httpx.HTTPStatusError(
+                            f"HTTP {response.status_code} after 3 attempts",
+                            request=response.request,
+                            response=response,
+                        )
+
+                response.raise_for_status()
+                data = response.json()
+
+                if "choices" in data and len(data["choices"]) > 0:
+                    content = data["choices"][0]["message"]["content"]
+                    print(f"   ✅ API call successful (attempt {attempt})")
+                    return content
+                elif "content" in data:
+                    content = data["content"]
+                    print(f"   ✅ API call successful (attempt {attempt})")
+                    return content
+                else:
+                    raise ValueError(f"Unexpected response format")
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code in [403, 429, 503] and attempt < 3:
@@ -203,9 +232,9 @@ class ToolPlannerPlugin(MCPPlugin):
             if json_end != -1:
                 response_clean = response_clean[: json_end + 1]
 
-        response_clean = re.sub(r"//.*?\n", "\n", response_clean)
-        response_clean = re.sub(r"/\*.*?\*/", "", response_clean, flags=re.DOTALL)
-        response_clean = re.sub(r",(\s*[}\]])", r"\1", response_clean)
+        response_clean = _LINE_COMMENT_RE.sub("\n", response_clean)
+        response_clean = _BLOCK_COMMENT_RE.sub("", response_clean)
+        response_clean = _TRAILING_COMMA_RE.sub(r"\1", response_clean)
 
         return response_clean
 
@@ -240,19 +269,13 @@ class ToolPlannerPlugin(MCPPlugin):
     def detect_language(self, text: str) -> str:
         """Detect primary language of text"""
         # Check for Korean characters (Hangul)
-        korean_chars = sum(1 for c in text if 0xAC00 <= ord(c) <= 0xD7A3)
+        korean_chars = len(_HANGUL_RE.findall(text))
 
         # Check for Japanese characters (Hiragana, Katakana, Kanji)
-        japanese_chars = sum(
-            1
-            for c in text
-            if (0x3040 <= ord(c) <= 0x309F)  # Hiragana
-            or (0x30A0 <= ord(c) <= 0x30FF)  # Katakana
-            or (0x4E00 <= ord(c) <= 0x9FFF)  # Kanji
-        )
+        japanese_chars = len(_JAPANESE_RE.findall(text))
 
         # Check for Chinese characters
-        chinese_chars = sum(1 for c in text if 0x4E00 <= ord(c) <= 0x9FFF)
+        chinese_chars = len(_CJK_RE.findall(text))
 
         total_chars = len(text)
 
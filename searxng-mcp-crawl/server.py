@@ -6,93 +6,135 @@ import uvicorn
 import asyncio
 from uuid import uuid4
 from plugin_manager import PluginManager
-import config
+from crawler import close_crawler
+from config import CFG
+
+try:
+    # C 기반 JSON 직렬화 (표준 json 대비 수 배 빠름)
+    import orjson
+except ImportError:
+    orjson = None
 
 print("=" * 60)
 print("🚀 Extensible MCP Server with Plugin System")
 print("=" * 60)
-print(f"Server: http://{config.HOST}:{config.PORT}")
+print(f"Server: http://{CFG.HOST}:{CFG.PORT}")
 print("=" * 60)
 
 # 플러그인 매니저 초기화
 plugin_manager = PluginManager(plugins_dir="plugins")
 active_connections = {}
+background_tasks = set()  # 실행 중인 SSE 요청 태스크 (GC로 사라지지 않도록 참조 유지)
 
 async def startup():
+    await plugin_manager.warmup_plugins()
     print("✅ Server ready")
 
 async def shutdown():
+    await plugin_manager.close_plugins()
+    await close_crawler()
     print("👋 Bye")
 
-async def handle_mcp(msg):
-    method = msg.get("method")
-    msg_id = msg.get("id")
-    params = msg.get("params", {})
-    
-    print(f"📨 {method}")
+def json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, indent=False):
+    """Serialize to str (orjson when available, pretty-printed if indent)"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available"""
     
-    # Initialize
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},
-                "serverInfo": {
-                    "name": "extensible-mcp-server",
-                    "version": "2.0.0"
-                }
+    def render(self, content) -> bytes:
+        if orjson:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+# Initialize
+async def handle_initialize(msg_id, params):
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {}},
+            "serverInfo": {
+                "name": "extensible-mcp-server",
+                "version": "2.0.0"
             }
         }
+    }
+
+# Initialized notification
+async def handle_initialized(msg_id, params):
+    return None
+
+# List tools (자동으로 플러그인 목록 반환)
+async def handle_tools_list(msg_id, params):
+    tools = plugin_manager.list_plugins()
+    print(f"   → {len(tools)} tools from plugins")
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {"tools": tools}
+    }
+
+# Call tool (플러그인 자동 실행)
+async def handle_tools_call(msg_id, params):
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
     
-    # Initialized notification
-    elif method == "notifications/initialized":
-        return None
+    print(f"   🔧 {tool_name}: {arguments}")
     
-    # List tools (자동으로 플러그인 목록 반환)
-    elif method == "tools/list":
-        tools = plugin_manager.list_plugins()
-        print(f"   → {len(tools)} tools from plugins")
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {"tools": tools}
-        }
+    # 플러그인 실행
+    result = await plugin_manager.execute_plugin(tool_name, arguments)
     
-    # Call tool (플러그인 자동 실행)
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-        
-        print(f"   🔧 {tool_name}: {arguments}")
-        
-        # 플러그인 실행
-        result = await plugin_manager.execute_plugin(tool_name, arguments)
-        
-        # JSON 문자열로 변환
-        result_text = json.dumps(result, indent=2, ensure_ascii=False)
-        
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "content": [{"type": "text", "text": result_text}]
-            }
+    # JSON 문자열로 변환
+    result_text = json_dumps(result, indent=True)
+    
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {
+            "content": [{"type": "text", "text": result_text}]
         }
+    }
+
+# Ping
+async def handle_ping(msg_id, params):
+    return {"jsonrpc": "2.0", "id": msg_id, "result": {}}
+
+# Reload plugins (특수 메서드)
+async def handle_plugins_reload(msg_id, params):
+    plugin_manager.reload_plugins()
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {"message": "Plugins reloaded", "count": len(plugin_manager.plugins)}
+    }
+
+# JSON-RPC 메서드 → 핸들러 (if/elif 체인 대신 한 번의 dict 조회로 분기)
+METHOD_HANDLERS = {
+    "initialize": handle_initialize,
+    "notifications/initialized": handle_initialized,
+    "tools/list": handle_tools_list,
+    "tools/call": handle_tools_call,
+    "ping": handle_ping,
+    "plugins/reload": handle_plugins_reload,
+}
+
+async def handle_mcp(msg):
+    method = msg.get("method")
+    msg_id = msg.get("id")
     
-    # Ping
-    elif method == "ping":
-        return {"jsonrpc": "2.0", "id": msg_id, "result": {}}
+    print(f"📨 {method}")
     
-    # Reload plugins (특수 메서드)
-    elif method == "plugins/reload":
-        plugin_manager.reload_plugins()
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {"message": "Plugins reloaded", "count": len(plugin_manager.plugins)}
-        }
+    handler = METHOD_HANDLERS.get(method)
+    if handler is not None:
+        return await handler(msg_id, msg.get("params", {}))
     
     return {
         "jsonrpc": "2.0",
@@ -112,29 +154,45 @@ async def sse_connect(request):
             while True:
                 m = await q.get()
                 if m is None: break
-                yield f"data: {json.dumps(m)}\n\n"
+                yield f"data: {json_dumps(m)}\n\n"
         finally:
             active_connections.pop(cid, None)
     
     return StreamingResponse(stream(), media_type="text/event-stream")
 
+async def dispatch_sse(cid, msg):
+    """Handle one SSE-transport message and push the reply to its stream"""
+    try:
+        resp = await handle_mcp(msg)
+    except Exception as e:
+        print(f"❌ {msg.get('method')} failed: {e}")
+        resp = {
+            "jsonrpc": "2.0",
+            "id": msg.get("id"),
+            "error": {"code": -32603, "message": str(e)}
+        }
+    if resp and cid in active_connections:
+        await active_connections[cid].put(resp)
+
 async def message_handler(request):
     cid = request.path_params["connection_id"]
     body = await request.body()
-    msg = json.loads(body)
-    resp = await handle_mcp(msg)
-    if resp and cid in active_connections:
-        await active_connections[cid].put(resp)
-    return JSONResponse({"ok": 1})
+    msg = json_loads(body)
+    
+    # 응답은 SSE 스트림으로 전달되므로 바로 202 반환 → 여러 도구 호출이 동시에 실행됨
+    task = asyncio.create_task(dispatch_sse(cid, msg))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return FastJSONResponse({"ok": 1}, status_code=202)
 
 async def post_handler(request):
     body = await request.body()
-    msg = json.loads(body)
+    msg = json_loads(body)
     resp = await handle_mcp(msg)
-    return JSONResponse(resp) if resp else JSONResponse({"ok": 1})
+    return FastJSONResponse(resp) if resp else FastJSONResponse({"ok": 1})
 
 async def health(request):
-    return JSONResponse({
+    return FastJSONResponse({
         "status": "ok",
         "plugins": len(plugin_manager.plugins),
         "available_tools": list(plugin_manager.plugins.keys())
@@ -152,4 +210,4 @@ app = Starlette(
 )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host=config.HOST, port=config.PORT)
\ No newline at end of file
+    uvicorn.run(app, host=CFG.HOST, port=CFG.PORT)
\ No newline at end of file
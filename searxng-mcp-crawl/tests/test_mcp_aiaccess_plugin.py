@@ -0,0 +1,46 @@
+import asyncio
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "plugins"))
+
+from mcp_aiaccess_plugin import MCPAIAccessPlugin, _validate_messages
+
+
+class ValidateMessagesTest(unittest.TestCase):
+    def test_valid_messages(self):
+        self.assertIsNone(_validate_messages([{"role": "user", "content": "hi"}]))
+
+    def test_unknown_role(self):
+        error = _validate_messages([{"role": "bot", "content": "hi"}])
+        self.assertEqual(error, "Message 0 invalid role: bot")
+
+    def test_non_string_role(self):
+        for role in (["user"], {"name": "user"}, 1):
+            error = _validate_messages([{"role": role, "content": "hi"}])
+            self.assertTrue(error.startswith("Message 0 invalid role"), error)
+
+    def test_non_string_content(self):
+        error = _validate_messages([{"role": "user", "content": ["hi"]}])
+        self.assertEqual(error, "Message 0 content must be a string")
+
+    def test_execute_returns_error_for_non_string_role(self):
+        result = asyncio.run(
+            MCPAIAccessPlugin().execute(
+                {
+                    "url": "http://llm.invalid/v1",
+                    "apiKey": "key",
+                    "model": "model",
+                    "messages": [{"role": ["user"], "content": "hi"}],
+                }
+            )
+        )
+        self.assertFalse(result["success"])
+        self.assertIn("invalid role", result["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()